@@ -4,6 +4,17 @@ __version__ = "0.1.0"
 __author__ = "DROMA Team"
 __email__ = "contact@droma.org"
 
-from .server import droma_mcp
+__all__ = ["droma_mcp"]
 
-__all__ = ["droma_mcp"] 
\ No newline at end of file
+
+def __getattr__(name):
+    # Import the server lazily so lightweight CLI commands do not pay for
+    # FastMCP, pandas and rpy2 at package import time.
+    if name == "droma_mcp":
+        from .server import droma_mcp
+        return droma_mcp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,6 +1,53 @@
 """Main entry point for DROMA MCP server."""
 
-from .cli import app
- 
+import sys
+
+# Commands that only print static text are answered here without importing
+# Typer or any of the server modules.
+_FAST_PATH_ARGS = ("info", "--version", "-h", "--help")
+
+_COMMANDS = (
+    ("run", "Start DROMA MCP Server with specified configuration."),
+    ("test", "Test DROMA MCP server configuration and dependencies."),
+    ("info", "Display information about DROMA MCP server."),
+    ("export-config", "Export MCP client configuration file."),
+    ("validate", "Validate complete DROMA MCP setup."),
+    ("benchmark", "Run performance benchmark."),
+)
+
+
+def _fast_path(argv):
+    """Handle info/version/help requests with a minimal argparse parser."""
+    import argparse
+    from . import __version__
+    
+    parser = argparse.ArgumentParser(
+        prog="droma-mcp",
+        description="DROMA MCP Server - Model Context Protocol server for drug-omics association analysis",
+    )
+    parser.add_argument("--version", action="version", version=f"droma-mcp {__version__}")
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+    for name, help_text in _COMMANDS:
+        subparsers.add_parser(name, help=help_text)
+    
+    args, _ = parser.parse_known_args(argv)
+    if args.command == "info":
+        from ._info import INFO_TEXT
+        sys.stdout.write(INFO_TEXT + "\n")
+    else:
+        parser.print_help()
+
+
+def main():
+    """Console script entry point."""
+    argv = sys.argv[1:]
+    if argv and argv[0] in _FAST_PATH_ARGS:
+        _fast_path(argv)
+        sys.exit(0)
+    
+    from .cli import app
+    app()
+
+
 if __name__ == "__main__":
-    app() 
\ No newline at end of file
+    main()
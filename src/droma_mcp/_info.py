@@ -0,0 +1,36 @@
+"""Static help text shared by the CLI entry points."""
+
+from . import __version__, __author__
+
+INFO_TEXT = f"""
+DROMA MCP Server v{__version__}
+{__author__}
+
+A Model Context Protocol server for drug-omics association analysis using DROMA.
+
+Available modules:
+  • all                - All modules (default)
+  • data_loading       - Data loading, caching, and normalization operations
+  • database_query     - Database query and exploration operations
+  • dataset_management - Dataset loading and management operations
+
+Available transports:
+  • stdio          - Standard input/output (default, for AI assistants)
+  • streamable-http - HTTP with streaming support
+  • sse            - Server-Sent Events
+
+Usage Examples:
+  droma-mcp run                              # Start with default settings
+  droma-mcp run -m data_loading              # Start with only data loading module
+  droma-mcp run -t streamable-http -p 8080   # Start HTTP server on port 8080
+  droma-mcp test --db-path path/to/db.sqlite # Test configuration
+  droma-mcp validate                         # Validate installation
+  droma-mcp benchmark                        # Run performance benchmark
+
+Environment Variables:
+  DROMA_DB_PATH         - Default database path
+  R_LIBS                - R library path
+  DROMA_MCP_VERBOSE     - Enable verbose logging
+
+Documentation: https://github.com/mugpeng/DROMA
+"""
@@ -1,8 +1,8 @@
 """Command-line interface for DROMA MCP server."""
 
+import functools
 import os
-import asyncio
-import json
+import sys
 from enum import Enum
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -10,7 +10,8 @@ from typing import Optional, Dict, Any
 import typer
 from typing_extensions import Annotated
 
-from . import __version__, __author__
+from . import __version__
+from ._info import INFO_TEXT as _INFO_TEXT
 
 
 class Module(str, Enum):
@@ -28,25 +29,175 @@ class Transport(str, Enum):
     SSE = "sse"
 
 
+# MCP client configuration builders, keyed by transport
+_CONFIG_TEMPLATES = {
+    Transport.STDIO: lambda host, port: {
+        "mcpServers": {
+            "droma-mcp": {
+                "command": "droma-mcp",
+                "args": ["run", "--module", "all", "--transport", "stdio"]
+            }
+        }
+    },
+    Transport.SHTTP: lambda host, port: {
+        "mcpServers": {
+            "droma-mcp": {
+                "transport": {
+                    "type": "http",
+                    "url": f"http://{host}:{port}/mcp"
+                }
+            }
+        }
+    },
+    Transport.SSE: lambda host, port: {
+        "mcpServers": {
+            "droma-mcp": {
+                "transport": {
+                    "type": "sse",
+                    "url": f"http://{host}:{port}/sse"
+                }
+            }
+        }
+    },
+}
+
+
+_DEPS_CACHE_FILE = Path.home() / ".cache" / "droma-mcp" / "deps.json"
+
+
+@functools.lru_cache(maxsize=None)
+def _r_environment() -> Optional[Dict[str, Any]]:
+    """Describe the R installation rpy2 would embed, without embedding it.
+    
+    Runs Rscript (from R_HOME if set, as rpy2 does, else from PATH) for the
+    R home, version and library paths, then records the mtime of each DROMA
+    package's DESCRIPTION in the first library holding it. Returns None if
+    Rscript cannot be run.
+    """
+    import shutil
+    import subprocess
+    
+    r_home = os.environ.get('R_HOME')
+    rscript = str(Path(r_home) / "bin" / "Rscript") if r_home else shutil.which("Rscript")
+    if not rscript:
+        return None
+    try:
+        completed = subprocess.run(
+            [rscript, "-e", 'cat(R.home(), R.version.string, .libPaths(), sep = "\\n")'],
+            capture_output=True, text=True, timeout=60, check=True
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    
+    lines = completed.stdout.splitlines()
+    if len(lines) < 2:
+        return None
+    home, version, lib_paths = lines[0], lines[1], lines[2:]
+    
+    package_mtimes = {}
+    for package in ("DROMA.Set", "DROMA.R"):
+        package_mtimes[package] = None
+        for lib_path in lib_paths:
+            try:
+                package_mtimes[package] = (Path(lib_path) / package / "DESCRIPTION").stat().st_mtime
+                break
+            except OSError:
+                continue
+    
+    return {
+        "home": home,
+        "version": version,
+        "lib_paths": lib_paths,
+        "package_mtimes": package_mtimes,
+    }
+
+
+def _deps_cache_key() -> Dict[str, Any]:
+    """Describe the environment a cached dependency probe is valid for."""
+    from importlib import metadata
+    
+    try:
+        rpy2_version = metadata.version("rpy2")
+    except metadata.PackageNotFoundError:
+        rpy2_version = None
+    
+    return {
+        "executable": sys.executable,
+        "rpy2": rpy2_version,
+        "r_libs": os.environ.get('R_LIBS'),
+        "r": _r_environment(),
+    }
+
+
+def _load_cached_deps() -> Optional[Dict[str, bool]]:
+    """Return persisted dependency results if they match this environment."""
+    import json
+    
+    try:
+        with open(_DEPS_CACHE_FILE) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    key = _deps_cache_key()
+    if key["r"] is None or cached.get("key") != key:
+        return None
+    return cached.get("results")
+
+
+def _store_cached_deps(results: Dict[str, bool]) -> None:
+    """Persist dependency results for subsequent CLI invocations."""
+    import json
+    
+    try:
+        _DEPS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(_DEPS_CACHE_FILE, 'w') as f:
+            json.dump({"key": _deps_cache_key(), "results": results}, f)
+    except OSError:
+        pass
+
+
 class DromaMCPCLI:
     """DROMA MCP Server CLI manager."""
     
-    def __init__(self):
+    # (command name, method name) pairs registered on the Typer app
+    _COMMANDS = (
+        ("run", "run"),
+        ("test", "test_connection"),
+        ("info", "info"),
+        ("export-config", "export_config"),
+        ("validate", "validate_setup"),
+        ("benchmark", "benchmark"),
+    )
+    
+    def __init__(self, command: Optional[str] = None):
         self.app = typer.Typer(
             name="droma-mcp",
             help="DROMA MCP Server - Model Context Protocol server for drug-omics association analysis",
             add_completion=False
         )
-        self._setup_commands()
+        self._deps_cache: Dict[bool, Dict[str, bool]] = {}
+        self._setup_commands(command)
     
-    def _setup_commands(self):
-        """Setup all CLI commands."""
-        self.app.command(name="run")(self.run)
-        self.app.command(name="test")(self.test_connection)
-        self.app.command(name="info")(self.info)
-        self.app.command(name="export-config")(self.export_config)
-        self.app.command(name="validate")(self.validate_setup)
-        self.app.command(name="benchmark")(self.benchmark)
+    def _setup_commands(self, command: Optional[str] = None):
+        """Setup CLI commands.
+        
+        Args:
+            command: If this names a known command, only that command is
+                registered, sparing Typer the signature inspection of the
+                others. Otherwise all commands are registered.
+        """
+        known = {name for name, _ in self._COMMANDS}
+        for name, method_name in self._COMMANDS:
+            if command in known and name != command:
+                continue
+            self.app.command(name=name)(getattr(self, method_name))
+        
+        # Keep subcommand-style parsing even when a single command is registered
+        self.app.callback()(self._main)
+    
+    def _main(self) -> None:
+        """DROMA MCP Server - Model Context Protocol server for drug-omics association analysis"""
     
     def _setup_environment(
         self,
@@ -56,19 +207,70 @@ class DromaMCPCLI:
         verbose: bool = False
     ) -> None:
         """Setup environment variables for the server."""
-        os.environ['DROMA_MCP_MODULE'] = module.value
+        env_updates = {'DROMA_MCP_MODULE': module.value}
         
         if db_path:
-            os.environ['DROMA_DB_PATH'] = db_path
+            env_updates['DROMA_DB_PATH'] = db_path
         
         if r_libs:
-            os.environ['R_LIBS'] = r_libs
+            env_updates['R_LIBS'] = r_libs
         
         if verbose:
-            os.environ['DROMA_MCP_VERBOSE'] = "1"
+            env_updates['DROMA_MCP_VERBOSE'] = "1"
+            # Server logs go to stderr so they never mix with the stdio transport
+            import logging
+            logging.basicConfig(level=logging.INFO)
+        
+        os.environ.update(env_updates)
+    
+    def _validate_dependencies(self, check_r: bool = True, deep: bool = False) -> Dict[str, bool]:
+        """Validate all dependencies.
+        
+        A shallow check only looks the modules up with importlib and never
+        starts R. A deep check imports them and loads the DROMA R packages;
+        its results are memoized for the lifetime of the CLI instance, and a
+        fully successful R probe is persisted to disk, keyed on the R home,
+        version, library paths and DROMA package mtimes reported by Rscript,
+        so later invocations can skip loading the packages in embedded R.
+        
+        Args:
+            check_r: Whether to probe rpy2 and the DROMA R packages. Starting
+                an embedded R session is expensive, so callers that only need
+                the Python dependency status can skip it.
+            deep: Whether to import the dependencies rather than only check
+                that they are installed. 'droma_packages' is only reported by
+                a deep check.
+        """
+        if not deep:
+            return self._find_dependencies(check_r)
+        
+        if check_r in self._deps_cache:
+            return dict(self._deps_cache[check_r])
+        
+        results = _load_cached_deps() if check_r else None
+        if results is None:
+            results = self._probe_dependencies(check_r)
+            if check_r and all(results.values()):
+                _store_cached_deps(results)
+        
+        self._deps_cache[check_r] = results
+        return dict(results)
     
-    def _validate_dependencies(self) -> Dict[str, bool]:
-        """Validate all dependencies."""
+    def _find_dependencies(self, check_r: bool) -> Dict[str, bool]:
+        """Check that dependencies are installed without importing them."""
+        from importlib.util import find_spec
+        
+        results = {
+            'python_deps': all(
+                find_spec(name) is not None for name in ('pandas', 'numpy', 'fastmcp')
+            )
+        }
+        if check_r:
+            results['r_integration'] = find_spec('rpy2') is not None
+        return results
+    
+    def _probe_dependencies(self, check_r: bool) -> Dict[str, bool]:
+        """Import each dependency to determine whether it is usable."""
         results = {}
         
         # Test Python dependencies
@@ -80,12 +282,13 @@ class DromaMCPCLI:
         except ImportError:
             results['python_deps'] = False
         
+        if not check_r:
+            return results
+        
         # Test R integration
         try:
             import rpy2.robjects as robjects
-            from rpy2.robjects import pandas2ri
             r = robjects.r
-            pandas2ri.activate()
             results['r_integration'] = True
         except ImportError:
             results['r_integration'] = False
@@ -96,9 +299,10 @@ class DromaMCPCLI:
             try:
                 import rpy2.robjects as robjects
                 r = robjects.r
-                r('library(DROMA.Set)')
-                r('library(DROMA.R)')
-                results['droma_packages'] = True
+                # requireNamespace checks availability without attaching
+                ok = r('requireNamespace("DROMA.Set", quietly = TRUE) && '
+                       'requireNamespace("DROMA.R", quietly = TRUE)')[0]
+                results['droma_packages'] = bool(ok)
             except Exception:
                 results['droma_packages'] = False
         
@@ -164,29 +368,26 @@ class DromaMCPCLI:
         self._setup_environment(module, db_path, r_libs, verbose)
         
         if verbose:
-            typer.echo(f"Starting DROMA MCP Server v{__version__}")
-            typer.echo(f"Configuration:")
-            typer.echo(f"  Module: {module.value}")
-            typer.echo(f"  Transport: {transport.value}")
+            lines = [
+                f"Starting DROMA MCP Server v{__version__}",
+                "Configuration:",
+                f"  Module: {module.value}",
+                f"  Transport: {transport.value}",
+            ]
             if transport != Transport.STDIO:
-                typer.echo(f"  Host: {host}")
-                typer.echo(f"  Port: {port}")
+                lines.append(f"  Host: {host}")
+                lines.append(f"  Port: {port}")
                 if transport == Transport.SHTTP:
-                    typer.echo(f"  Path: {path}")
+                    lines.append(f"  Path: {path}")
             if db_path:
-                typer.echo(f"  Database: {db_path}")
+                lines.append(f"  Database: {db_path}")
             if r_libs:
-                typer.echo(f"  R Libraries: {r_libs}")
+                lines.append(f"  R Libraries: {r_libs}")
+            typer.echo("\n".join(lines))
         
         try:
-            # Import and setup server
-            from .server import droma_mcp
-            from .util import setup_server
-            
-            # Run setup
-            asyncio.run(setup_server())
-            
-            # Start server with appropriate transport
+            # Server modules are imported by the transport runners so that
+            # argument parsing and validation stay cheap.
             self._start_server(transport, host, port, path)
             
         except ImportError as e:
@@ -201,38 +402,62 @@ class DromaMCPCLI:
     
     def _start_server(self, transport: Transport, host: str, port: int, path: str):
         """Start the server with the specified transport."""
-        from .server import droma_mcp
-        
         if transport == Transport.STDIO:
-            typer.echo("Starting server with STDIO transport...")
-            droma_mcp.run()
-            
+            self._run_stdio()
         elif transport == Transport.SHTTP:
-            from .util import get_data_export, get_figure
-            from starlette.routing import Route
-            
-            typer.echo(f"Starting server with Streamable HTTP transport on {host}:{port}{path}")
-            
-            # Add HTTP routes for data export and figures
-            droma_mcp._additional_http_routes = [
-                Route("/download/export/{data_id}", endpoint=get_data_export),
-                Route("/download/figure/{figure_name}", endpoint=get_figure)
-            ]
-            
-            droma_mcp.run(
-                transport="streamable-http",
-                host=host,
-                port=port,
-                path=path
-            )
-            
+            self._run_shttp(host, port, path)
         elif transport == Transport.SSE:
-            typer.echo(f"Starting server with SSE transport on {host}:{port}")
-            droma_mcp.run(
-                transport="sse",
-                host=host,
-                port=port
-            )
+            self._run_sse(host, port)
+    
+    def _prepare_server(self):
+        """Import the server and run utility setup before accepting requests."""
+        import asyncio
+        from .server import droma_mcp
+        from .util import setup_server
+        
+        asyncio.run(setup_server())
+        return droma_mcp
+    
+    def _run_stdio(self):
+        """Start the server with STDIO transport."""
+        # Utility setup is scheduled by the server lifespan instead, so the
+        # STDIO handshake is not delayed by it.
+        from .server import droma_mcp
+        
+        typer.echo("Starting server with STDIO transport...")
+        droma_mcp.run()
+    
+    def _run_shttp(self, host: str, port: int, path: str):
+        """Start the server with Streamable HTTP transport."""
+        droma_mcp = self._prepare_server()
+        from .util import get_data_export, get_figure
+        from starlette.routing import Route
+        
+        typer.echo(f"Starting server with Streamable HTTP transport on {host}:{port}{path}")
+        
+        # Add HTTP routes for data export and figures
+        droma_mcp._additional_http_routes = [
+            Route("/download/export/{data_id}", endpoint=get_data_export),
+            Route("/download/figure/{figure_name}", endpoint=get_figure)
+        ]
+        
+        droma_mcp.run(
+            transport="streamable-http",
+            host=host,
+            port=port,
+            path=path
+        )
+    
+    def _run_sse(self, host: str, port: int):
+        """Start the server with SSE transport."""
+        droma_mcp = self._prepare_server()
+        
+        typer.echo(f"Starting server with SSE transport on {host}:{port}")
+        droma_mcp.run(
+            transport="sse",
+            host=host,
+            port=port
+        )
     
     def test_connection(
         self,
@@ -251,12 +476,12 @@ class DromaMCPCLI:
         
         # Test dependencies
         typer.echo("\n1. Testing dependencies...")
-        deps = self._validate_dependencies()
+        deps = self._validate_dependencies(deep=True)
         
-        for dep, status in deps.items():
-            status_icon = "✓" if status else "✗"
-            dep_name = dep.replace('_', ' ').title()
-            typer.echo(f"  {status_icon} {dep_name}")
+        lines = [
+            f"  {'✓' if status else '✗'} {dep.replace('_', ' ').title()}"
+            for dep, status in deps.items()
+        ]
         
         # Test R version and packages details
         if deps['r_integration']:
@@ -264,20 +489,22 @@ class DromaMCPCLI:
                 import rpy2.robjects as robjects
                 r = robjects.r
                 r_version = r('R.version.string')[0]
-                typer.echo(f"    R Version: {r_version}")
+                lines.append(f"    R Version: {r_version}")
                 
                 if deps['droma_packages']:
                     # Check package versions
                     try:
                         droma_set_version = r('packageVersion("DROMA.Set")')[0]
                         droma_r_version = r('packageVersion("DROMA.R")')[0]
-                        typer.echo(f"    DROMA.Set: v{droma_set_version}")
-                        typer.echo(f"    DROMA.R: v{droma_r_version}")
+                        lines.append(f"    DROMA.Set: v{droma_set_version}")
+                        lines.append(f"    DROMA.R: v{droma_r_version}")
                     except:
                         pass
             except:
                 pass
         
+        typer.echo("\n".join(lines))
+        
         # Test database connection
         if db_path:
             typer.echo(f"\n2. Testing database: {db_path}")
@@ -310,13 +537,22 @@ class DromaMCPCLI:
         try:
             import sqlite3
             conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
             
-            # Check for required tables
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            tables = [row[0] for row in cursor.fetchall()]
+            # Read-only probe with a small page cache and memory-mapped I/O
+            conn.execute("PRAGMA query_only = ON")
+            conn.execute("PRAGMA cache_size = -2000")  # 2MB
+            conn.execute("PRAGMA mmap_size = 268435456")  # 256MB
             
+            # Check for required tables
             required_tables = ['sample_anno', 'drug_anno']
+            placeholders = ",".join("?" for _ in required_tables)
+            tables = {
+                row[0] for row in conn.execute(
+                    f"SELECT name FROM sqlite_master WHERE type='table' AND name IN ({placeholders})",
+                    required_tables
+                )
+            }
+            
             for table in required_tables:
                 if table in tables:
                     typer.echo(f"    ✓ Table '{table}' found")
@@ -331,39 +567,7 @@ class DromaMCPCLI:
     
     def info(self) -> None:
         """Display information about DROMA MCP server."""
-        
-        typer.echo(f"""
-DROMA MCP Server v{__version__}
-{__author__}
-
-A Model Context Protocol server for drug-omics association analysis using DROMA.
-
-Available modules:
-  • all                - All modules (default)
-  • data_loading       - Data loading, caching, and normalization operations
-  • database_query     - Database query and exploration operations
-  • dataset_management - Dataset loading and management operations
-
-Available transports:
-  • stdio          - Standard input/output (default, for AI assistants)
-  • streamable-http - HTTP with streaming support
-  • sse            - Server-Sent Events
-
-Usage Examples:
-  droma-mcp run                              # Start with default settings
-  droma-mcp run -m data_loading              # Start with only data loading module
-  droma-mcp run -t streamable-http -p 8080   # Start HTTP server on port 8080
-  droma-mcp test --db-path path/to/db.sqlite # Test configuration
-  droma-mcp validate                         # Validate installation
-  droma-mcp benchmark                        # Run performance benchmark
-
-Environment Variables:
-  DROMA_DB_PATH         - Default database path
-  R_LIBS                - R library path
-  DROMA_MCP_VERBOSE     - Enable verbose logging
-
-Documentation: https://github.com/mugpeng/DROMA
-""")
+        typer.echo(_INFO_TEXT)
     
     def export_config(
         self,
@@ -385,6 +589,7 @@ Documentation: https://github.com/mugpeng/DROMA
         )] = 8000,
     ) -> None:
         """Export MCP client configuration file."""
+        import json
         
         config = self._generate_config(transport, host, port)
         
@@ -395,44 +600,14 @@ Documentation: https://github.com/mugpeng/DROMA
     
     def _generate_config(self, transport: Transport, host: str, port: int) -> Dict[str, Any]:
         """Generate MCP client configuration."""
-        if transport == Transport.STDIO:
-            return {
-                "mcpServers": {
-                    "droma-mcp": {
-                        "command": "droma-mcp",
-                        "args": ["run", "--module", "all", "--transport", "stdio"]
-                    }
-                }
-            }
-        elif transport == Transport.SHTTP:
-            return {
-                "mcpServers": {
-                    "droma-mcp": {
-                        "transport": {
-                            "type": "http",
-                            "url": f"http://{host}:{port}/mcp"
-                        }
-                    }
-                }
-            }
-        elif transport == Transport.SSE:
-            return {
-                "mcpServers": {
-                    "droma-mcp": {
-                        "transport": {
-                            "type": "sse",
-                            "url": f"http://{host}:{port}/sse"
-                        }
-                    }
-                }
-            }
+        return _CONFIG_TEMPLATES[transport](host, port)
     
     def validate_setup(self) -> None:
         """Validate complete DROMA MCP setup."""
         typer.echo("Validating DROMA MCP setup...")
         
         # Check dependencies
-        deps = self._validate_dependencies()
+        deps = self._validate_dependencies(deep=True)
         
         # Check environment variables
         env_vars = {
@@ -447,39 +622,39 @@ Documentation: https://github.com/mugpeng/DROMA
             'src/droma_mcp/schema/__init__.py',
         ]
         
-        # Report results
-        typer.echo("\n📋 Validation Results:")
-        typer.echo("━━━━━━━━━━━━━━━━━━━━")
-        
-        typer.echo("Dependencies:")
-        for dep, status in deps.items():
-            icon = "✅" if status else "❌"
-            typer.echo(f"  {icon} {dep.replace('_', ' ').title()}")
+        # Report results as a single write
+        lines = ["\n📋 Validation Results:", "━━━━━━━━━━━━━━━━━━━━", "Dependencies:"]
+        lines.extend(
+            f"  {'✅' if status else '❌'} {dep.replace('_', ' ').title()}"
+            for dep, status in deps.items()
+        )
         
-        typer.echo("\nEnvironment:")
+        lines.append("\nEnvironment:")
         for var, value in env_vars.items():
             icon = "✅" if value else "⚠️"
             status = f"Set to: {value}" if value else "Not set"
-            typer.echo(f"  {icon} {var}: {status}")
+            lines.append(f"  {icon} {var}: {status}")
         
-        typer.echo("\nPackage Structure:")
-        for file_path in package_files:
-            exists = Path(file_path).exists()
-            icon = "✅" if exists else "❌"
-            typer.echo(f"  {icon} {file_path}")
+        lines.append("\nPackage Structure:")
+        lines.extend(
+            f"  {'✅' if Path(file_path).exists() else '❌'} {file_path}"
+            for file_path in package_files
+        )
         
         # Overall assessment
         all_deps = all(deps.values())
-        typer.echo(f"\n{'🎉' if all_deps else '⚠️'} Overall Status: {'Ready to use' if all_deps else 'Issues found'}")
+        lines.append(f"\n{'🎉' if all_deps else '⚠️'} Overall Status: {'Ready to use' if all_deps else 'Issues found'}")
         
         if not all_deps:
-            typer.echo("\n💡 Recommendations:")
+            lines.append("\n💡 Recommendations:")
             if not deps['python_deps']:
-                typer.echo("  • Install Python dependencies: pip install -e .")
+                lines.append("  • Install Python dependencies: pip install -e .")
             if not deps['r_integration']:
-                typer.echo("  • Install R integration: pip install rpy2")
+                lines.append("  • Install R integration: pip install rpy2")
             if not deps['droma_packages']:
-                typer.echo("  • Install DROMA R packages")
+                lines.append("  • Install DROMA R packages")
+        
+        typer.echo("\n".join(lines))
     
     def benchmark(
         self,
@@ -491,42 +666,85 @@ Documentation: https://github.com/mugpeng/DROMA
             "-m", "--module",
             help="Module to benchmark"
         )] = Module.ALL,
+        importtime_log: Annotated[Optional[str], typer.Option(
+            "--importtime-log",
+            help="Write the -X importtime breakdown of the slowest import to this file"
+        )] = None,
     ) -> None:
         """Run performance benchmark."""
+        import statistics
+        import subprocess
         import time
         
         typer.echo(f"Running DROMA MCP benchmark ({iterations} iterations)...")
         
-        # Test import performance
-        start_time = time.time()
-        try:
-            from .server import droma_mcp
-            import_time = time.time() - start_time
-            typer.echo(f"✓ Import time: {import_time:.3f}s")
-        except Exception as e:
-            typer.echo(f"✗ Import failed: {e}")
-            return
+        # Time cold imports in fresh interpreters; an in-process import would
+        # only measure the already-populated sys.modules cache.
+        env = dict(os.environ, DROMA_MCP_MODULE=module.value)
+        src_dir = str(Path(__file__).resolve().parents[1])
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [src_dir, env.get('PYTHONPATH')]))
+        
+        command = [sys.executable]
+        if importtime_log:
+            command += ["-X", "importtime"]
+        command += ["-c", "import droma_mcp.server"]
+        
+        times = []
+        slowest_log = ""
+        for _ in range(max(iterations, 1)):
+            start_time = time.perf_counter()
+            result = subprocess.run(command, env=env, capture_output=True, text=True)
+            elapsed = time.perf_counter() - start_time
+            if result.returncode != 0:
+                error = result.stderr.strip().splitlines()[-1:] or ["unknown error"]
+                typer.echo(f"✗ Import failed: {error[0]}")
+                return
+            if not times or elapsed > max(times):
+                slowest_log = result.stderr
+            times.append(elapsed)
+        
+        times.sort()
+        p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+        typer.echo(
+            f"✓ Cold import time: median={statistics.median(times) * 1000:.1f}ms, "
+            f"p95={p95 * 1000:.1f}ms"
+        )
         
-        # Test R integration performance
-        if self._validate_dependencies()['r_integration']:
-            start_time = time.time()
-            try:
-                import rpy2.robjects as robjects
-                from rpy2.robjects import pandas2ri
-                pandas2ri.activate()
-                r = robjects.r
-                r('library(DROMA.Set)')
-                r_time = time.time() - start_time
-                typer.echo(f"✓ R setup time: {r_time:.3f}s")
-            except Exception as e:
-                typer.echo(f"✗ R setup failed: {e}")
+        if importtime_log:
+            with open(importtime_log, 'w') as f:
+                f.write(slowest_log)
+            typer.echo(f"  Import time breakdown written to: {importtime_log}")
+        
+        # Test R integration performance in a fresh interpreter so the
+        # measurement includes booting the embedded R session
+        deps = self._validate_dependencies()
+        if deps['r_integration']:
+            r_script = (
+                "import time; t = time.perf_counter(); "
+                "import rpy2.robjects as robjects; robjects.r('library(DROMA.Set)'); "
+                "print(time.perf_counter() - t)"
+            )
+            result = subprocess.run(
+                [sys.executable, "-c", r_script], env=env, capture_output=True, text=True
+            )
+            if result.returncode == 0:
+                typer.echo(f"✓ R setup time (cold): {float(result.stdout.strip().splitlines()[-1]):.3f}s")
+            else:
+                error = result.stderr.strip().splitlines()[-1:] or ["unknown error"]
+                typer.echo(f"✗ R setup failed: {error[0]}")
         
         typer.echo("Benchmark completed!")
 
 
-# Create CLI instance
-cli = DromaMCPCLI()
-app = cli.app
+def _build_app(argv: Optional[list] = None) -> typer.Typer:
+    """Build the Typer app with only the commands needed to parse argv."""
+    command = argv[0] if argv else None
+    return DromaMCPCLI(command).app
+
+
+def app() -> None:
+    """Run the CLI, building the Typer app on first use."""
+    _build_app(sys.argv[1:])()
 
 # For backwards compatibility
 if __name__ == "__main__":
@@ -1,8 +1,19 @@
 """Pydantic schemas for DROMA MCP data validation."""
 
+# Shared enums
+from ._enums import (
+    DataType,
+    MolecularType,
+    MergeStrategy,
+    ExportFormat,
+    AnnoType,
+    AnnotationFormat,
+    DatasetType,
+    Precision
+)
+
 # Data loading schemas
 from .data_loading import (
-    MolecularType,
     LoadMolecularProfilesModel,
     LoadTreatmentResponseModel,
     MultiProjectMolecularProfilesModel,
@@ -17,7 +28,6 @@ from .data_loading import (
 
 # Database query schemas
 from .database_query import (
-    DataType,
     GetAnnotationModel,
     ListSamplesModel,
     ListFeaturesModel,
@@ -29,13 +39,20 @@ from .dataset_management import (
     LoadDatasetModel,
     ListDatasetsModel,
     SetActiveDatasetModel,
-    UnloadDatasetModel
+    UnloadDatasetModel,
+    UnloadDatasetsModel
 )
 
 __all__ = [
     # Enums
     "MolecularType",
     "DataType",
+    "AnnoType",
+    "AnnotationFormat",
+    "MergeStrategy",
+    "ExportFormat",
+    "DatasetType",
+    "Precision",
     # Data loading models
     "LoadMolecularProfilesModel",
     "LoadTreatmentResponseModel", 
@@ -56,5 +73,6 @@ __all__ = [
     "LoadDatasetModel",
     "ListDatasetsModel",
     "SetActiveDatasetModel",
-    "UnloadDatasetModel"
+    "UnloadDatasetModel",
+    "UnloadDatasetsModel"
 ] 
\ No newline at end of file
@@ -0,0 +1,66 @@
+"""Enumerations shared by the DROMA MCP schemas."""
+
+from enum import Enum
+
+
+class DataType(str, Enum):
+    """Supported data types."""
+    ALL = "all"
+    CELL_LINE = "CellLine"
+    PDO = "PDO"
+    PDC = "PDC"
+    PDX = "PDX"
+
+
+class MolecularType(str, Enum):
+    """Supported molecular data types."""
+    MRNA = "mRNA"
+    CNV = "cnv"
+    METH = "meth"
+    PROTEIN_RPPA = "proteinrppa"
+    PROTEIN_MS = "proteinms"
+    MUTATION_GENE = "mutation_gene"
+    MUTATION_SITE = "mutation_site"
+    FUSION = "fusion"
+
+
+class MergeStrategy(str, Enum):
+    """Strategies for combining features across datasets."""
+    INTERSECT = "intersect"
+    UNION = "union"
+    SEPARATE = "separate"
+
+
+class ExportFormat(str, Enum):
+    """Supported export file formats."""
+    CSV = "csv"
+    EXCEL = "excel"
+    JSON = "json"
+    PARQUET = "parquet"
+    FEATHER = "feather"
+
+
+class Precision(str, Enum):
+    """Floating point precision for loaded molecular profiles."""
+    F32 = "f32"
+    F64 = "f64"
+
+
+class AnnotationFormat(str, Enum):
+    """Layouts for annotation rows in tool responses."""
+    RECORDS = "records"
+    COLUMNAR = "columnar"
+    ARROW = "arrow"
+    PARQUET = "parquet"
+
+
+class AnnoType(str, Enum):
+    """Supported annotation types."""
+    SAMPLE = "sample"
+    DRUG = "drug"
+
+
+class DatasetType(str, Enum):
+    """Supported DROMA dataset types."""
+    DROMA_SET = "DromaSet"
+    MULTI_DROMA_SET = "MultiDromaSet"
@@ -1,28 +1,17 @@
 """Pydantic schemas for DROMA data loading operations."""
 
-from pydantic import BaseModel, Field
-from typing import List, Optional, Literal
-from enum import Enum
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Optional, Tuple
 
 # Import shared enums
-from .database_query import DataType
-
-
-class MolecularType(str, Enum):
-    """Supported molecular data types."""
-    MRNA = "mRNA"
-    CNV = "cnv"
-    METH = "meth"
-    PROTEIN_RPPA = "proteinrppa"
-    PROTEIN_MS = "proteinms"
-    MUTATION_GENE = "mutation_gene"
-    MUTATION_SITE = "mutation_site"
-    FUSION = "fusion"
+from ._enums import DataType, MolecularType, MergeStrategy, ExportFormat, Precision
 
 
 class LoadMolecularProfilesModel(BaseModel):
     """Schema for loading molecular profiles with z-score normalization."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     dataset_name: str = Field(
         description="Dataset name (e.g., 'CCLE', 'gCSI')"
     )
@@ -45,11 +34,21 @@ class LoadMolecularProfilesModel(BaseModel):
         default=True,
         description="Whether to apply z-score normalization"
     )
+    precision: Precision = Field(
+        default=Precision.F32,
+        description="Float precision of the loaded matrix: 'f32' halves memory, 'f64' keeps R's doubles"
+    )
+    stats_only: bool = Field(
+        default=False,
+        description="Compute summary statistics in R and cache only those instead of the full matrix"
+    )
 
 
 class LoadTreatmentResponseModel(BaseModel):
     """Schema for loading treatment response data with z-score normalization."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     dataset_name: str = Field(
         description="Dataset name (e.g., 'CCLE', 'gCSI')"
     )
@@ -74,6 +73,8 @@ class LoadTreatmentResponseModel(BaseModel):
 class MultiProjectMolecularProfilesModel(BaseModel):
     """Schema for loading multi-project molecular profiles with z-score normalization."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     multidromaset_id: str = Field(
         description="MultiDromaSet object identifier"
     )
@@ -100,11 +101,17 @@ class MultiProjectMolecularProfilesModel(BaseModel):
         default=True,
         description="Whether to apply z-score normalization"
     )
+    precision: Precision = Field(
+        default=Precision.F32,
+        description="Float precision of the loaded matrices: 'f32' halves memory, 'f64' keeps R's doubles"
+    )
 
 
 class MultiProjectTreatmentResponseModel(BaseModel):
     """Schema for loading multi-project treatment response data with z-score normalization."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     multidromaset_id: str = Field(
         description="MultiDromaSet object identifier"
     )
@@ -133,6 +140,8 @@ class MultiProjectTreatmentResponseModel(BaseModel):
 class ZscoreNormalizationModel(BaseModel):
     """Schema for z-score normalization operations."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     data_id: str = Field(
         description="Identifier for the data to normalize"
     )
@@ -145,10 +154,12 @@ class ZscoreNormalizationModel(BaseModel):
 class DataValidationModel(BaseModel):
     """Schema for data validation responses."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     is_normalized: bool = Field(
         description="Whether data has been z-score normalized"
     )
-    data_shape: tuple = Field(
+    data_shape: Tuple[int, int] = Field(
         description="Shape of the data matrix (rows, columns)"
     )
     feature_count: int = Field(
@@ -168,6 +179,8 @@ class DataValidationModel(BaseModel):
 class BatchLoadModel(BaseModel):
     """Schema for batch loading operations."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     dromaset_ids: List[str] = Field(
         description="List of DromaSet identifiers to load"
     )
@@ -182,8 +195,8 @@ class BatchLoadModel(BaseModel):
         default=True,
         description="Whether to normalize each dataset separately"
     )
-    merge_strategy: Literal["intersect", "union", "separate"] = Field(
-        default="separate",
+    merge_strategy: MergeStrategy = Field(
+        default=MergeStrategy.SEPARATE,
         description="How to handle features across datasets"
     )
 
@@ -191,14 +204,22 @@ class BatchLoadModel(BaseModel):
 class CheckZScoreNormalizationModel(BaseModel):
     """Schema for checking z-score normalization status."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     cache_key: str = Field(
         description="Cache key of the dataset to check"
     )
+    full_scan: bool = Field(
+        default=False,
+        description="Compute statistics over every cell instead of a sample of large matrices"
+    )
 
 
 class GetCachedDataInfoModel(BaseModel):
     """Schema for getting cached data information."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     cache_key: Optional[str] = Field(
         default=None,
         description="Specific cache key to get info for. If None, returns info for all cached data"
@@ -212,11 +233,13 @@ class GetCachedDataInfoModel(BaseModel):
 class ExportCachedDataModel(BaseModel):
     """Schema for exporting cached data."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     cache_key: str = Field(
         description="Cache key of the dataset to export"
     )
-    format: Literal["csv", "excel", "json"] = Field(
-        default="csv",
+    format: ExportFormat = Field(
+        default=ExportFormat.CSV,
         description="Export format"
     )
     filename: Optional[str] = Field(
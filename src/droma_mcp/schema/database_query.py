@@ -1,23 +1,30 @@
 """Pydantic schemas for DROMA database query operations."""
 
-from pydantic import BaseModel, Field
-from typing import List, Optional, Literal
-from enum import Enum
+import re
 
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import List, Optional
 
-class DataType(str, Enum):
-    """Supported data types."""
-    ALL = "all"
-    CELL_LINE = "CellLine"
-    PDO = "PDO"
-    PDC = "PDC"
-    PDX = "PDX"
+# Import shared enums
+from ._enums import DataType, AnnoType, AnnotationFormat
+
+
+def _validate_regex(pattern: Optional[str]) -> Optional[str]:
+    """Reject invalid regex patterns at the tool boundary."""
+    if pattern is not None:
+        try:
+            re.compile(pattern)
+        except re.error as e:
+            raise ValueError(f"Invalid regex pattern '{pattern}': {e}") from e
+    return pattern
 
 
 class GetAnnotationModel(BaseModel):
     """Schema for retrieving annotation data from DROMA database."""
     
-    anno_type: Literal["sample", "drug"] = Field(
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    anno_type: AnnoType = Field(
         description="Type of annotation to retrieve: 'sample' or 'drug'"
     )
     project_name: Optional[str] = Field(
@@ -40,11 +47,21 @@ class GetAnnotationModel(BaseModel):
         default=None,
         description="Maximum number of records to return"
     )
+    output_format: AnnotationFormat = Field(
+        default=AnnotationFormat.RECORDS,
+        description="'records' returns a list of row dicts; 'columnar' returns column names once plus a list of row values; 'arrow' and 'parquet' return a base64-encoded Arrow IPC stream or Parquet file (need pyarrow)"
+    )
+    include_total: bool = Field(
+        default=True,
+        description="Whether to count the annotation table's total records (cached until the database changes)"
+    )
 
 
 class ListSamplesModel(BaseModel):
     """Schema for listing available samples in DROMA database."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     project_name: str = Field(
         description="Name of the project (e.g., 'gCSI', 'CCLE')"
     )
@@ -68,11 +85,18 @@ class ListSamplesModel(BaseModel):
         default=None,
         description="Regex pattern to filter sample names"
     )
+    
+    @field_validator("pattern")
+    @classmethod
+    def validate_pattern(cls, v: Optional[str]) -> Optional[str]:
+        return _validate_regex(v)
 
 
 class ListFeaturesModel(BaseModel):
     """Schema for listing available features in DROMA database."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     project_name: str = Field(
         description="Name of the project (e.g., 'gCSI', 'CCLE')"
     )
@@ -95,11 +119,18 @@ class ListFeaturesModel(BaseModel):
         default=None,
         description="Regex pattern to filter feature names"
     )
+    
+    @field_validator("pattern")
+    @classmethod
+    def validate_pattern(cls, v: Optional[str]) -> Optional[str]:
+        return _validate_regex(v)
 
 
 class ListProjectsModel(BaseModel):
     """Schema for listing available projects in DROMA database."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     show_names_only: bool = Field(
         default=False,
         description="If True returns only a list of project names"
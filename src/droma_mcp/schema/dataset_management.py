@@ -1,17 +1,22 @@
 """Pydantic schemas for DROMA dataset management operations."""
 
-from pydantic import BaseModel, Field
-from typing import Optional, List, Literal
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, List
+
+# Import shared enums
+from ._enums import DatasetType
 
 
 class LoadDatasetModel(BaseModel):
     """Schema for loading DROMA datasets."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     dataset_id: str = Field(
         description="Dataset identifier (e.g., 'CCLE', 'gCSI', or comma-separated for MultiDromaSet like 'CCLE,gCSI')"
     )
-    dataset_type: Literal["DromaSet", "MultiDromaSet"] = Field(
-        default="DromaSet",
+    dataset_type: DatasetType = Field(
+        default=DatasetType.DROMA_SET,
         description="Type of dataset to load: 'DromaSet' for single datasets or 'MultiDromaSet' for multiple projects"
     )
     db_path: Optional[str] = Field(
@@ -27,6 +32,8 @@ class LoadDatasetModel(BaseModel):
 class ListDatasetsModel(BaseModel):
     """Schema for listing loaded datasets."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     include_details: bool = Field(
         default=False,
         description="Whether to include detailed information about each dataset"
@@ -36,11 +43,13 @@ class ListDatasetsModel(BaseModel):
 class SetActiveDatasetModel(BaseModel):
     """Schema for setting the active dataset."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     dataset_id: str = Field(
         description="Dataset identifier to set as active"
     )
-    dataset_type: Literal["DromaSet", "MultiDromaSet"] = Field(
-        default="DromaSet",
+    dataset_type: DatasetType = Field(
+        default=DatasetType.DROMA_SET,
         description="Type of dataset: 'DromaSet' or 'MultiDromaSet'"
     )
 
@@ -48,10 +57,27 @@ class SetActiveDatasetModel(BaseModel):
 class UnloadDatasetModel(BaseModel):
     """Schema for unloading datasets from memory."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     dataset_id: str = Field(
         description="Dataset identifier to unload"
     )
-    dataset_type: Literal["DromaSet", "MultiDromaSet"] = Field(
-        default="DromaSet",
+    dataset_type: DatasetType = Field(
+        default=DatasetType.DROMA_SET,
         description="Type of dataset: 'DromaSet' or 'MultiDromaSet'"
+    )
+
+
+class UnloadDatasetsModel(BaseModel):
+    """Schema for unloading several datasets from memory at once."""
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    dataset_ids: List[str] = Field(
+        min_length=1,
+        description="Dataset identifiers to unload"
+    )
+    dataset_type: DatasetType = Field(
+        default=DatasetType.DROMA_SET,
+        description="Type of the datasets: 'DromaSet' or 'MultiDromaSet'"
     ) 
\ No newline at end of file
@@ -1,36 +1,109 @@
 """DROMA MCP Server initialization and state management."""
 
 import os
+import re
+import logging
+import sys
+import time
+import asyncio
+import threading
+import functools
+import importlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Any, Dict, Optional
+from typing import AsyncIterator, Any, Dict, Final, NamedTuple, Optional
 from fastmcp import FastMCP
-import pandas as pd
-from pathlib import Path
+
+from ..schema._enums import DatasetType
+
+logger = logging.getLogger(__name__)
+
+# Characters allowed in R object names created for loaded datasets
+_R_NAME_RE = re.compile(r'[A-Za-z0-9_]+')
+
+
+class CacheEntry(NamedTuple):
+    """A cached data object with its metadata."""
+    data: Any
+    metadata: Dict[str, Any]
+    timestamp: int  # Wall-clock time in nanoseconds
+    nbytes: int
+    summary: Dict[str, Any]  # Type and shape, computed once on insert
+
+
+def _estimate_nbytes(data: Any) -> int:
+    """Estimate the in-memory size of a cached object."""
+    memory_usage = getattr(data, 'memory_usage', None)
+    if memory_usage is not None:
+        try:
+            # pandas DataFrame / Series
+            usage = memory_usage(deep=True)
+            return int(usage.sum() if hasattr(usage, 'sum') else usage)
+        except TypeError:
+            pass
+    nbytes = getattr(data, 'nbytes', None)  # numpy arrays
+    if isinstance(nbytes, int):
+        return nbytes
+    return sys.getsizeof(data)
 
 
 class DromaState:
     """Manages DROMA datasets and analysis state."""
     
+    __slots__ = (
+        'datasets', 'multidatasets', '_datasets_snapshot',
+        '_active_dataset', '_active_multidataset', '_active_obj', '_active_multi_obj',
+        'analysis_cache', 'data_cache', 'metadata',
+        '_cache_bytes', '_cache_max_entries', '_cache_max_bytes',
+        'r', '_globalenv', '_create_droma', '_create_multi', '_r_lock', '_r_initialized',
+        '_r_executor',
+    )
+    
     def __init__(self):
-        self.datasets: Dict[str, Any] = {}  # {dataset_id: DromaSet_object}
-        self.multidatasets: Dict[str, Any] = {}  # {dataset_id: MultiDromaSet_object}
-        self.active_dataset: Optional[str] = None
-        self.active_multidataset: Optional[str] = None
-        self.analysis_cache: Dict[str, Any] = {}
-        self.data_cache: Dict[str, Any] = {}  # Cache for loaded data
-        self.metadata: Dict[str, Any] = {}
+        self.datasets: Final[Dict[str, Any]] = {}  # {dataset_id: DromaSet_object}
+        self.multidatasets: Final[Dict[str, Any]] = {}  # {dataset_id: MultiDromaSet_object}
+        self._datasets_snapshot = None  # list_datasets() result, rebuilt after loads/removals
+        self.active_dataset = None
+        self.active_multidataset = None
+        self.analysis_cache: Final[Dict[str, Any]] = {}
+        # LRU cache for loaded data, bounded by entry count and total bytes
+        self.data_cache: Final["OrderedDict[str, CacheEntry]"] = OrderedDict()
+        self._cache_bytes = 0
+        self._cache_max_entries = int(os.environ.get('DROMA_CACHE_MAX', 64))
+        self._cache_max_bytes = int(os.environ.get('DROMA_CACHE_MAX_BYTES', 2 * 1024 ** 3))
+        self.metadata: Final[Dict[str, Any]] = {}
         
-        # R environment setup
-        self._setup_r_environment()
+        # R environment is set up on first use (or warmed up by the lifespan)
+        self.r = None
+        self._r_lock = threading.Lock()
+        self._r_initialized = False
+        # R is single-threaded: every R call runs on this one worker thread so
+        # the event loop is never blocked and rpy2 is only used from one thread
+        self._r_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="droma-r")
+    
+    def ensure_r(self):
+        """Return the R interface, initializing it on first use."""
+        if not self._r_initialized:
+            with self._r_lock:
+                if not self._r_initialized:
+                    self._setup_r_environment()
+                    self._r_initialized = True
+        return self.r
+    
+    def run_r(self, func, *args, **kwargs) -> "asyncio.Future":
+        """Run a callable that uses R on the dedicated R thread."""
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._r_executor, functools.partial(func, *args, **kwargs))
+    
+    def close(self):
+        """Stop the R worker thread."""
+        self._r_executor.shutdown(wait=False, cancel_futures=True)
     
     def _setup_r_environment(self):
         """Initialize R environment and load DROMA packages."""
         try:
             import rpy2.robjects as robjects
-            from rpy2.robjects import pandas2ri
-            
-            # Activate automatic pandas to R conversion
-            pandas2ri.activate()
             
             # Load required R libraries
             robjects.r('''
@@ -39,101 +112,181 @@ class DromaState:
             ''')
             
             self.r = robjects.r
-            print("R environment initialized successfully")
+            self._globalenv = robjects.globalenv
+            
+            # Look the loaders up once so they can be called without parsing R code
+            self._create_droma = robjects.r['createDromaSetFromDatabase']
+            self._create_multi = robjects.r['createMultiDromaSetFromDatabase']
+            logger.info("R environment initialized successfully")
             
         except Exception as e:
-            print(f"Warning: Could not initialize R environment: {e}")
+            logger.warning("Could not initialize R environment: %s", e)
             self.r = None
     
     def load_dataset(self, dataset_id: str, db_path: str, dataset_type: str = "DromaSet"):
         """Load DROMA dataset by ID."""
-        if self.r is None:
+        if self.ensure_r() is None:
             raise RuntimeError("R environment not available")
+        
+        # The identifier becomes an R variable name, so only allow safe characters
+        r_name = dataset_id.replace(",", "_")
+        if not _R_NAME_RE.fullmatch(r_name):
+            raise ValueError(
+                f"Invalid dataset identifier '{dataset_id}': use letters, digits and underscores"
+            )
             
         try:
             if dataset_type == "DromaSet":
                 # Load single DromaSet
-                self.r(f'''
-                    {dataset_id} <- createDromaSetFromDatabase("{dataset_id}", "{db_path}")
-                ''')
+                self._globalenv[dataset_id] = self._create_droma(dataset_id, db_path)
                 self.datasets[dataset_id] = dataset_id  # Store R object name
                 
             elif dataset_type == "MultiDromaSet":
-                # Load MultiDromaSet (assuming dataset_id is comma-separated project names)
-                project_names = dataset_id.split(",")
-                project_names_r = 'c("' + '", "'.join(project_names) + '")'
+                from rpy2.robjects.vectors import StrVector
                 
-                self.r(f'''
-                    {dataset_id.replace(",", "_")} <- createMultiDromaSetFromDatabase(
-                        {project_names_r}, "{db_path}"
-                    )
-                ''')
-                self.multidatasets[dataset_id] = dataset_id.replace(",", "_")
+                # Load MultiDromaSet (assuming dataset_id is comma-separated project names)
+                project_names = StrVector(dataset_id.split(","))
                 
-            print(f"Successfully loaded dataset: {dataset_id}")
+                self._globalenv[r_name] = self._create_multi(project_names, db_path)
+                self.multidatasets[dataset_id] = r_name
+            
+            self._datasets_snapshot = None
+            logger.info("Successfully loaded dataset: %s", dataset_id)
             return True
             
         except Exception as e:
-            print(f"Error loading dataset {dataset_id}: {e}")
+            logger.error("Error loading dataset %s: %s", dataset_id, e)
             return False
     
+    @property
+    def active_dataset(self) -> Optional[str]:
+        """Identifier of the active DromaSet."""
+        return self._active_dataset
+    
+    @active_dataset.setter
+    def active_dataset(self, dataset_id: Optional[str]):
+        self._active_dataset = dataset_id
+        self._active_obj = self.datasets.get(dataset_id) if dataset_id else None
+    
+    @property
+    def active_multidataset(self) -> Optional[str]:
+        """Identifier of the active MultiDromaSet."""
+        return self._active_multidataset
+    
+    @active_multidataset.setter
+    def active_multidataset(self, dataset_id: Optional[str]):
+        self._active_multidataset = dataset_id
+        self._active_multi_obj = self.multidatasets.get(dataset_id) if dataset_id else None
+    
     def get_dataset(self, dataset_id: Optional[str] = None) -> Optional[str]:
         """Get active or specified dataset."""
-        if dataset_id:
-            return self.datasets.get(dataset_id)
-        return self.datasets.get(self.active_dataset) if self.active_dataset else None
+        if not dataset_id:
+            return self._active_obj
+        return self.datasets.get(dataset_id)
     
     def get_multidataset(self, dataset_id: Optional[str] = None) -> Optional[str]:
         """Get active or specified multidataset."""
-        if dataset_id:
-            return self.multidatasets.get(dataset_id)
-        return self.multidatasets.get(self.active_multidataset) if self.active_multidataset else None
+        if not dataset_id:
+            return self._active_multi_obj
+        return self.multidatasets.get(dataset_id)
     
     def cache_data(self, key: str, data: Any, metadata: Optional[Dict] = None):
-        """Cache data with optional metadata."""
-        self.data_cache[key] = {
-            'data': data,
-            'metadata': metadata or {},
-            'timestamp': pd.Timestamp.now()
-        }
+        """Cache data with optional metadata, evicting least recently used entries."""
+        nbytes = _estimate_nbytes(data)
+        previous = self.data_cache.pop(key, None)
+        if previous is not None:
+            self._cache_bytes -= previous.nbytes
+        
+        # Evict oldest entries until the new one fits; it is always kept itself
+        while self.data_cache and (
+            len(self.data_cache) >= self._cache_max_entries
+            or self._cache_bytes + nbytes > self._cache_max_bytes
+        ):
+            _, evicted = self.data_cache.popitem(last=False)
+            self._cache_bytes -= evicted.nbytes
+        
+        summary = {'data_type': str(type(data)), 'shape': getattr(data, 'shape', None)}
+        self.data_cache[key] = CacheEntry(data, metadata or {}, time.time_ns(), nbytes, summary)
+        self._cache_bytes += nbytes
+    
+    @property
+    def cache_bytes(self) -> int:
+        """Estimated memory held by data_cache, in bytes."""
+        return self._cache_bytes
     
     def get_cached_data(self, key: str) -> Optional[Any]:
-        """Retrieve cached data."""
-        cached = self.data_cache.get(key)
-        return cached['data'] if cached else None
+        """Retrieve cached data and mark it as recently used."""
+        if (cached := self.data_cache.get(key)) is None:
+            return None
+        self.data_cache.move_to_end(key)
+        return cached.data
     
     def list_datasets(self) -> Dict[str, str]:
-        """List all loaded datasets."""
-        return {
-            'datasets': list(self.datasets.keys()),
-            'multidatasets': list(self.multidatasets.keys())
-        }
+        """List all loaded datasets.
+        
+        The snapshot is shared between calls until a dataset is loaded or
+        removed, so callers must not modify it.
+        """
+        if self._datasets_snapshot is None:
+            self._datasets_snapshot = {
+                'datasets': list(self.datasets.keys()),
+                'multidatasets': list(self.multidatasets.keys())
+            }
+        return self._datasets_snapshot
+    
+    def remove_dataset(self, dataset_id: str, dataset_type: str = "DromaSet") -> Optional[str]:
+        """Forget a loaded dataset, returning its R object name (None if it was not loaded)."""
+        if DatasetType(dataset_type) is DatasetType.DROMA_SET:
+            registry, attr = self.datasets, 'active_dataset'
+        else:
+            registry, attr = self.multidatasets, 'active_multidataset'
+        r_name = registry.pop(dataset_id, None)
+        if r_name is None:
+            return None
+        
+        # Clear the active dataset if this was it
+        if getattr(self, attr) == dataset_id:
+            setattr(self, attr, None)
+        self._datasets_snapshot = None
+        return r_name
     
     def set_active_dataset(self, dataset_id: str, dataset_type: str = "DromaSet"):
         """Set the active dataset."""
-        if dataset_type == "DromaSet" and dataset_id in self.datasets:
-            self.active_dataset = dataset_id
-        elif dataset_type == "MultiDromaSet" and dataset_id in self.multidatasets:
-            self.active_multidataset = dataset_id
+        if DatasetType(dataset_type) is DatasetType.DROMA_SET:
+            registry, attr = self.datasets, 'active_dataset'
         else:
+            registry, attr = self.multidatasets, 'active_multidataset'
+        if dataset_id not in registry:
             raise ValueError(f"Dataset {dataset_id} not found")
+        setattr(self, attr, dataset_id)
 
 
 @asynccontextmanager
 async def droma_lifespan(server: FastMCP) -> AsyncIterator[DromaState]:
     """Lifespan context manager for DROMA MCP server."""
-    print("Initializing DROMA MCP Server...")
+    logger.info("Initializing DROMA MCP Server...")
     
-    # Create DROMA state
-    state = DromaState()
+    # Import and mount the selected sub-servers
+    _mount_modules(os.environ.get('DROMA_MCP_MODULE', 'all'))
     
-    # Set up temp directories for exports
-    export_dir = Path.home() / ".droma_mcp" / "exports"
-    export_dir.mkdir(parents=True, exist_ok=True)
+    # Run utility setup in the background; it is a no-op when the CLI has
+    # already completed it before starting an HTTP transport.
+    setup_task = asyncio.create_task(setup_server())
     
-    yield state
+    # Create DROMA state and load the R packages in the background so the
+    # server can accept connections before R is ready
+    state = DromaState()
+    r_task = asyncio.ensure_future(state.run_r(state.ensure_r))
     
-    print("Shutting down DROMA MCP Server...")
+    try:
+        yield state
+    finally:
+        if not setup_task.done():
+            setup_task.cancel()
+        if not r_task.done():
+            r_task.cancel()
+        state.close()
+        logger.info("Shutting down DROMA MCP Server...")
 
 
 # Create the main FastMCP server instance
@@ -145,21 +298,35 @@ async def setup_server():
     from ..util import setup_server as util_setup
     await util_setup()
 
-# Module loading based on environment variable
-module = os.environ.get('DROMA_MCP_MODULE', 'all')
+# Sub-servers by module name: (module path, server attribute, mount prefix)
+_MODULE_REGISTRY = {
+    'data_loading': ('.data_loading', 'data_loading_mcp', '/data'),
+    'database_query': ('.database_query', 'database_query_mcp', '/query'),
+    'dataset_management': ('.dataset_management', 'dataset_management_mcp', '/datasets'),
+}
+_mounted_modules = set()
+
+
+def _mount(name: str) -> None:
+    """Import and mount a sub-server, at most once per process."""
+    if name in _mounted_modules:
+        return
+    module_path, attr, prefix = _MODULE_REGISTRY[name]
+    mod = importlib.import_module(module_path, __package__)
+    droma_mcp.mount(server=getattr(mod, attr), prefix=prefix)
+    _mounted_modules.add(name)
 
-if module in ['all', 'data_loading']:
-    from .data_loading import data_loading_mcp
-    droma_mcp.mount("/data", data_loading_mcp)
 
-if module in ['all', 'database_query']:
-    from .database_query import database_query_mcp
-    droma_mcp.mount("/query", database_query_mcp)
+def _mount_modules(module: str) -> None:
+    """Mount the sub-servers selected by DROMA_MCP_MODULE."""
+    names = list(_MODULE_REGISTRY) if module == 'all' else [module]
+    for name in names:
+        if name in _MODULE_REGISTRY:
+            _mount(name)
 
-if module in ['all', 'dataset_management']:
-    from .dataset_management import dataset_management_mcp
-    droma_mcp.mount("/datasets", dataset_management_mcp)
 
-print(f"DROMA MCP Server initialized with module: {module}")
+# Module loading based on environment variable; sub-servers are imported and
+# mounted when the server starts rather than at import time
+logger.info("DROMA MCP Server initialized with module: %s", os.environ.get('DROMA_MCP_MODULE', 'all'))
 
-__all__ = ["droma_mcp", "DromaState", "setup_server"] 
\ No newline at end of file
+__all__ = ["droma_mcp", "DromaState", "CacheEntry", "setup_server"] 
\ No newline at end of file
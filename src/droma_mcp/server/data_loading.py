@@ -1,60 +1,277 @@
 """DROMA MCP server for data loading operations."""
 
+import asyncio
+import functools
+import logging
+from datetime import datetime
 from fastmcp import FastMCP, Context
 from typing import Dict, Optional, Any, Union
+import numpy as np
 import pandas as pd
 
 from ..schema.data_loading import (
+    Precision,
     LoadMolecularProfilesModel,
     LoadTreatmentResponseModel,
     MultiProjectMolecularProfilesModel,
     MultiProjectTreatmentResponseModel
 )
 
+logger = logging.getLogger(__name__)
+
 # Create sub-MCP server for data loading
 data_loading_mcp = FastMCP("DROMA-Data-Loading")
 
+# Number of cells sampled for the z-score sanity check statistics
+_ZSCORE_SAMPLE_SIZE = 100_000
+
 
-def _convert_r_to_python(r_result) -> Union[pd.DataFrame, Dict[str, Any], list]:
-    """Convert R result to Python data structures."""
+@functools.cache
+def _rpy2_conversion():
+    """Import rpy2's conversion API once per process.
+    
+    Returns (localconverter, default converter, default + pandas converter),
+    or None if rpy2 is not installed. The import is deferred to first use
+    because importing rpy2.robjects starts the embedded R session.
+    """
+    try:
+        from rpy2.robjects import default_converter, pandas2ri
+        from rpy2.robjects.conversion import localconverter
+    except ImportError:
+        return None
+    
+    return localconverter, default_converter, default_converter + pandas2ri.converter
+
+
+@functools.cache
+def _arrow_bridge():
+    """Return (R helper, rpy2_arrow module) if Arrow transfer is available, else None."""
     try:
         import rpy2.robjects as robjects
-        from rpy2.robjects import pandas2ri
-        
-        # Activate pandas conversion
-        pandas2ri.activate()
-        
-        # Check if it's a list (multi-project case)
-        if hasattr(r_result, 'rclass') and 'list' in r_result.rclass:
-            # Handle list of data frames (multi-project results)
-            result_list = []
-            for i, item in enumerate(r_result):
-                if hasattr(item, 'rclass') and ('matrix' in item.rclass or 'data.frame' in item.rclass):
-                    # Convert each data frame in the list
-                    pandas_df = pandas2ri.rpy2py(item)
-                    result_list.append(pandas_df)
-                else:
-                    # Keep non-dataframe items as is
-                    result_list.append({"r_object": str(item), "type": str(type(item))})
-            pandas2ri.deactivate()
-            return result_list
-            
-        # Check if it's a single matrix or data.frame
-        elif hasattr(r_result, 'rclass') and ('matrix' in r_result.rclass or 'data.frame' in r_result.rclass):
-            # Convert R matrix or data.frame to pandas DataFrame
-            pandas_df = pandas2ri.rpy2py(r_result)
-            pandas2ri.deactivate()
-            return pandas_df
-        else:
-            # Return as dictionary for other R objects
-            pandas2ri.deactivate()
-            return {"r_object": str(r_result), "type": str(type(r_result))}
+        import rpy2_arrow.arrow as pyra
+    except ImportError:
+        return None
+    
+    if not robjects.r('requireNamespace("arrow", quietly = TRUE)')[0]:
+        return None
+    
+    # Row names do not survive the Arrow table, so return them alongside it
+    to_arrow = robjects.r('''
+        function(x) {
+            df <- as.data.frame(x)
+            list(arrow::as_arrow_table(df), rownames(df))
+        }
+    ''')
+    return to_arrow, pyra
+
+
+@functools.cache
+def _r_summary_stats():
+    """Return an R function computing a matrix's summary statistics in R."""
+    import rpy2.robjects as robjects
+    
+    return robjects.r('''
+        function(x) {
+            m <- as.matrix(x)
+            list(shape = dim(m), has_na = anyNA(m), mean = mean(m, na.rm = TRUE),
+                 sd = sd(m, na.rm = TRUE), min = min(m, na.rm = TRUE),
+                 max = max(m, na.rm = TRUE))
+        }
+    ''')
+
+
+def _summarize_in_r(r_obj) -> Dict[str, Any]:
+    """Summarise an R matrix without converting it to pandas.
+    
+    Only a handful of scalars cross from R to Python.
+    """
+    r_stats = _r_summary_stats()(r_obj)
+    stats = {name: value[0] for name, value in zip(r_stats.names, r_stats)}
+    stats["shape"] = tuple(int(n) for n in r_stats.rx2("shape"))
+    stats["has_na"] = bool(stats["has_na"])
+    return stats
+
+
+def _to_float32(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast the float64 columns of a frame to float32."""
+    float64_columns = df.select_dtypes(include=np.float64).columns
+    if len(float64_columns) == 0:
+        return df
+    return df.astype({column: np.float32 for column in float64_columns})
+
+
+def _has_missing(df: pd.DataFrame) -> bool:
+    """Check a frame for missing values with a single array reduction."""
+    values = df.to_numpy()
+    if np.issubdtype(values.dtype, np.floating):
+        return bool(np.isnan(values).any())
+    return bool(pd.isna(values).any())
+
+
+def _r_frame_to_pandas(r_obj, cv) -> pd.DataFrame:
+    """Convert an R matrix or data.frame to pandas, via Arrow when available."""
+    bridge = _arrow_bridge()
+    if bridge is not None:
+        localconverter, default_converter, _ = _rpy2_conversion()
+        to_arrow, pyra = bridge
+        try:
+            with localconverter(default_converter):
+                r_table, row_names = to_arrow(r_obj)
+            # One chunk per column lets pandas adopt the Arrow buffers without copying
+            table = pyra.rarrow_to_py_table(r_table).combine_chunks()
+            df = table.to_pandas(split_blocks=True, self_destruct=True, use_threads=True)
+            df.index = list(row_names)
+            return df
+        except Exception:
+            pass  # Fall back to the pandas2ri conversion below
+    return cv.rpy2py(r_obj)
+
+
+def _profile_cache_key(base: str, precision: Precision, stats_only: bool = False) -> str:
+    """Build a molecular profile cache key that keeps each load variant separate.
+    
+    Statistics-only loads and f64 matrices get their own suffix, so they never
+    replace a cached f32 matrix (or each other) under the same key.
+    """
+    if stats_only:
+        # R computes the statistics from its doubles whatever the precision
+        return f"{base}_stats"
+    if precision is not Precision.F32:
+        return f"{base}_{precision.value}"
+    return base
+
+
+def _format_timestamp(timestamp: Optional[int]) -> str:
+    """Format a cache entry's nanosecond timestamp for display."""
+    if timestamp is None:
+        return str(timestamp)
+    return str(datetime.fromtimestamp(timestamp / 1e9))
+
+
+def _str_vector(values: Optional[list]):
+    """Convert an optional list of strings to an R character vector or NULL."""
+    from rpy2.robjects import NULL, StrVector
+    
+    return StrVector(values) if values else NULL
+
+
+def _convert_r_to_python(r_result, float32: bool = False) -> Union[pd.DataFrame, Dict[str, Any], list]:
+    """Convert R result to Python data structures.
+    
+    With float32=True, numeric matrices are downcast from R's doubles to
+    halve their memory footprint.
+    """
+    conversion = _rpy2_conversion()
+    if conversion is None:
+        return {"error": "rpy2 is not installed", "r_result": str(r_result)}
+    localconverter, _, pandas_converter = conversion
+    
+    try:
+        # Scope pandas conversion to this call instead of activating it globally
+        with localconverter(pandas_converter) as cv:
+            # Check if it's a list (multi-project case)
+            if hasattr(r_result, 'rclass') and 'list' in r_result.rclass:
+                # Handle list of data frames (multi-project results)
+                result_list = []
+                for i, item in enumerate(r_result):
+                    if hasattr(item, 'rclass') and ('matrix' in item.rclass or 'data.frame' in item.rclass):
+                        # Convert each data frame in the list
+                        pandas_df = _r_frame_to_pandas(item, cv)
+                        result_list.append(_to_float32(pandas_df) if float32 else pandas_df)
+                    else:
+                        # Keep non-dataframe items as is
+                        result_list.append({"r_object": str(item), "type": str(type(item))})
+                return result_list
+                
+            # Check if it's a single matrix or data.frame
+            elif hasattr(r_result, 'rclass') and ('matrix' in r_result.rclass or 'data.frame' in r_result.rclass):
+                # Convert R matrix or data.frame to pandas DataFrame
+                pandas_df = _r_frame_to_pandas(r_result, cv)
+                return _to_float32(pandas_df) if float32 else pandas_df
+            else:
+                # Return as dictionary for other R objects
+                return {"r_object": str(r_result), "type": str(type(r_result))}
             
     except Exception as e:
-        print(f"Error converting R result: {e}")
+        logger.exception("R conversion failed")
         return {"error": str(e), "r_result": str(r_result)}
 
 
+def _result_stats(python_result, count_label: str, multi_project: bool) -> Dict[str, Any]:
+    """Summarise a loader result for the tool response."""
+    if isinstance(python_result, dict) and "shape" in python_result:
+        # Statistics computed in R by a stats_only load
+        return {
+            "shape": python_result["shape"],
+            count_label: python_result["shape"][0],
+            "samples_count": python_result["shape"][1],
+            "has_missing_values": python_result["has_na"]
+        }
+    if isinstance(python_result, pd.DataFrame):
+        return {
+            "shape": python_result.shape,
+            count_label: len(python_result.index),
+            "samples_count": len(python_result.columns),
+            "has_missing_values": _has_missing(python_result)
+        }
+    if isinstance(python_result, list):
+        project_stats = {}
+        for i, data in enumerate(python_result):
+            if isinstance(data, pd.DataFrame):
+                project_name = f"project_{i+1}"  # or get actual project names if available
+                project_stats[project_name] = {
+                    "shape": data.shape,
+                    count_label: len(data.index),
+                    "samples_count": len(data.columns)
+                }
+        return {"projects": project_stats, "total_projects": len(python_result)}
+    return {"result_type": "unknown" if multi_project else "non_matrix"}
+
+
+async def _run_r_loader(
+    droma_state,
+    r_func_name: str,
+    r_object_name: str,
+    r_kwargs: Dict[str, Any],
+    cache_key: str,
+    cache_meta: Dict[str, Any],
+    count_label: str,
+    multi_project: bool = False,
+    float32: bool = False,
+    stats_only: bool = False
+) -> Dict[str, Any]:
+    """Run a DROMA R loader, convert and cache its result, and return its stats.
+    
+    List values in r_kwargs are passed as R character vectors and None as NULL.
+    """
+    def _load():
+        # Call the R loader directly so no R source has to be generated or parsed
+        r = droma_state.r
+        kwargs = {
+            key: _str_vector(value) if value is None or isinstance(value, list) else value
+            for key, value in r_kwargs.items()
+        }
+        result = r[r_func_name](r[r_object_name], **kwargs)
+        if stats_only:
+            # Summarise in R and skip the R -> pandas copy of the matrix
+            return _summarize_in_r(result)
+        if multi_project:
+            r_result = r['lapply'](result, r['as.data.frame'])
+        else:
+            r_result = r['as.data.frame'](result)
+        
+        # Convert result to Python
+        return _convert_r_to_python(r_result, float32=float32)
+    
+    # R calls and conversion run on the R thread, off the event loop
+    python_result = await droma_state.run_r(_load)
+    
+    # Cache the result
+    droma_state.cache_data(cache_key, python_result, cache_meta)
+    
+    return _result_stats(python_result, count_label, multi_project)
+
+
 @data_loading_mcp.tool()
 async def load_molecular_profiles_normalized(
     ctx: Context,
@@ -77,52 +294,35 @@ async def load_molecular_profiles_normalized(
         }
     
     try:
-        # Build R command
-        features_str = "NULL"
-        if request.features:
-            features_str = 'c("' + '", "'.join(request.features) + '")'
-        
-        r_command = f'''
-        result <- loadMolecularProfilesNormalized(
-            {dataset_r_name},
-            molecular_type = "{request.molecular_type.value}",
-            features = {features_str},
-            data_type = "{request.data_type.value}",
-            tumor_type = "{request.tumor_type}",
-            zscore = {str(request.z_score).upper()}
-        )
-        result <- as.data.frame(result)
-        '''
-        
         await ctx.info(f"Executing R command for molecular profiles: {request.molecular_type.value}")
         
-        # Execute R command
-        droma_state.r(r_command)
-        r_result = droma_state.r('result')
-        
-        # Convert result to Python
-        python_result = _convert_r_to_python(r_result)
-        
-        # Cache the result
-        cache_key = f"mol_profiles_{request.dataset_name}_{request.molecular_type.value}"
-        droma_state.cache_data(cache_key, python_result, {
-            "molecular_type": request.molecular_type.value,
-            "zscore_normalized": request.z_score,
-            "features": request.features,
-            "data_type": request.data_type.value,
-            "tumor_type": request.tumor_type
-        })
-        
-        # Get basic stats
-        if isinstance(python_result, pd.DataFrame):
-            stats = {
-                "shape": python_result.shape,
-                "features_count": len(python_result.index),
-                "samples_count": len(python_result.columns),
-                "has_missing_values": python_result.isnull().any().any()
-            }
-        else:
-            stats = {"result_type": "non_matrix"}
+        cache_key = _profile_cache_key(
+            f"mol_profiles_{request.dataset_name}_{request.molecular_type.value}",
+            request.precision, request.stats_only
+        )
+        stats = await _run_r_loader(
+            droma_state, 'loadMolecularProfilesNormalized', dataset_r_name,
+            {
+                "molecular_type": request.molecular_type.value,
+                "features": request.features,
+                "data_type": request.data_type.value,
+                "tumor_type": request.tumor_type,
+                "zscore": request.z_score
+            },
+            cache_key,
+            {
+                "molecular_type": request.molecular_type.value,
+                "zscore_normalized": request.z_score,
+                "features": request.features,
+                "data_type": request.data_type.value,
+                "tumor_type": request.tumor_type,
+                "precision": request.precision.value,
+                "stats_only": request.stats_only
+            },
+            count_label="features_count",
+            float32=request.precision is Precision.F32,
+            stats_only=request.stats_only
+        )
         
         await ctx.info(f"Successfully loaded molecular profiles: {stats}")
         
@@ -134,7 +334,7 @@ async def load_molecular_profiles_normalized(
             "stats": stats,
             "message": f"Loaded {request.molecular_type.value} data for {request.dataset_name}"
         }
-        
+    
     except Exception as e:
         await ctx.error(f"Error loading molecular profiles: {str(e)}")
         return {
@@ -165,50 +365,26 @@ async def load_treatment_response_normalized(
         }
     
     try:
-        # Build R command
-        drugs_str = "NULL"
-        if request.drugs:
-            drugs_str = 'c("' + '", "'.join(request.drugs) + '")'
-        
-        r_command = f'''
-        result <- loadTreatmentResponseNormalized(
-            {dataset_r_name},
-            drugs = {drugs_str},
-            data_type = "{request.data_type.value}",
-            tumor_type = "{request.tumor_type}",
-            zscore = {str(request.z_score).upper()}
-        )
-        result <- as.data.frame(result)
-        '''
-        
         await ctx.info(f"Executing R command for treatment response data")
         
-        # Execute R command
-        droma_state.r(r_command)
-        r_result = droma_state.r('result')
-        
-        # Convert result to Python
-        python_result = _convert_r_to_python(r_result)
-        
-        # Cache the result
         cache_key = f"treatment_response_{request.dataset_name}"
-        droma_state.cache_data(cache_key, python_result, {
-            "drugs": request.drugs,
-            "zscore_normalized": request.z_score,
-            "data_type": request.data_type.value,
-            "tumor_type": request.tumor_type
-        })
-        
-        # Get basic stats
-        if isinstance(python_result, pd.DataFrame):
-            stats = {
-                "shape": python_result.shape,
-                "drugs_count": len(python_result.index),
-                "samples_count": len(python_result.columns),
-                "has_missing_values": python_result.isnull().any().any()
-            }
-        else:
-            stats = {"result_type": "non_matrix"}
+        stats = await _run_r_loader(
+            droma_state, 'loadTreatmentResponseNormalized', dataset_r_name,
+            {
+                "drugs": request.drugs,
+                "data_type": request.data_type.value,
+                "tumor_type": request.tumor_type,
+                "zscore": request.z_score
+            },
+            cache_key,
+            {
+                "drugs": request.drugs,
+                "zscore_normalized": request.z_score,
+                "data_type": request.data_type.value,
+                "tumor_type": request.tumor_type
+            },
+            count_label="drugs_count"
+        )
         
         await ctx.info(f"Successfully loaded treatment response data: {stats}")
         
@@ -220,7 +396,7 @@ async def load_treatment_response_normalized(
             "stats": stats,
             "message": f"Loaded treatment response data for {request.dataset_name}"
         }
-        
+    
     except Exception as e:
         await ctx.error(f"Error loading treatment response: {str(e)}")
         return {
@@ -251,58 +427,36 @@ async def load_multi_project_molecular_profiles_normalized(
         }
     
     try:
-        # Build R command
-        features_str = "NULL"
-        if request.features:
-            features_str = 'c("' + '", "'.join(request.features) + '")'
-        
-        r_command = f'''
-        result <- loadMultiProjectMolecularProfilesNormalized(
-            {multidataset_r_name},
-            molecular_type = "{request.molecular_type.value}",
-            features = {features_str},
-            overlap_only = {str(request.overlap_only).upper()},
-            data_type = "{request.data_type.value}",
-            tumor_type = "{request.tumor_type}",
-            zscore = {str(request.zscore).upper()}
-        )
-        result <- lapply(result, as.data.frame)
-        '''
-        
         await ctx.info(f"Executing R command for multi-project molecular profiles")
         
-        # Execute R command
-        droma_state.r(r_command)
-        r_result = droma_state.r('result')
-        
-        # Convert result to Python (should be a list of matrices)
-        python_result = _convert_r_to_python(r_result)
-        
-        # Cache the result
-        cache_key = f"multi_mol_profiles_{request.multidromaset_id}_{request.molecular_type.value}"
-        droma_state.cache_data(cache_key, python_result, {
-            "molecular_type": request.molecular_type.value,
-            "zscore_normalized": request.zscore,
-            "features": request.features,
-            "overlap_only": request.overlap_only,
-            "data_type": request.data_type.value,
-            "tumor_type": request.tumor_type
-        })
-        
-        # Get basic stats for multi-project data
-        if isinstance(python_result, list):
-            project_stats = {}
-            for i, data in enumerate(python_result):
-                if isinstance(data, pd.DataFrame):
-                    project_name = f"project_{i+1}"  # or get actual project names if available
-                    project_stats[project_name] = {
-                        "shape": data.shape,
-                        "features_count": len(data.index),
-                        "samples_count": len(data.columns)
-                    }
-            stats = {"projects": project_stats, "total_projects": len(python_result)}
-        else:
-            stats = {"result_type": "unknown"}
+        cache_key = _profile_cache_key(
+            f"multi_mol_profiles_{request.multidromaset_id}_{request.molecular_type.value}",
+            request.precision
+        )
+        stats = await _run_r_loader(
+            droma_state, 'loadMultiProjectMolecularProfilesNormalized', multidataset_r_name,
+            {
+                "molecular_type": request.molecular_type.value,
+                "features": request.features,
+                "overlap_only": request.overlap_only,
+                "data_type": request.data_type.value,
+                "tumor_type": request.tumor_type,
+                "zscore": request.zscore
+            },
+            cache_key,
+            {
+                "molecular_type": request.molecular_type.value,
+                "zscore_normalized": request.zscore,
+                "features": request.features,
+                "overlap_only": request.overlap_only,
+                "data_type": request.data_type.value,
+                "tumor_type": request.tumor_type,
+                "precision": request.precision.value
+            },
+            count_label="features_count",
+            multi_project=True,
+            float32=request.precision is Precision.F32
+        )
         
         await ctx.info(f"Successfully loaded multi-project molecular profiles: {stats}")
         
@@ -315,7 +469,7 @@ async def load_multi_project_molecular_profiles_normalized(
             "stats": stats,
             "message": f"Loaded multi-project {request.molecular_type.value} data"
         }
-        
+    
     except Exception as e:
         await ctx.error(f"Error loading multi-project molecular profiles: {str(e)}")
         return {
@@ -346,56 +500,29 @@ async def load_multi_project_treatment_response_normalized(
         }
     
     try:
-        # Build R command
-        drugs_str = "NULL"
-        if request.drugs:
-            drugs_str = 'c("' + '", "'.join(request.drugs) + '")'
-        
-        r_command = f'''
-        result <- loadMultiProjectTreatmentResponseNormalized(
-            {multidataset_r_name},
-            drugs = {drugs_str},
-            overlap_only = {str(request.overlap_only).upper()},
-            data_type = "{request.data_type.value}",
-            tumor_type = "{request.tumor_type}",
-            zscore = {str(request.zscore).upper()}
-        )
-        result <- lapply(result, as.data.frame)
-        '''
-        
         await ctx.info(f"Executing R command for multi-project treatment response")
         
-        # Execute R command
-        droma_state.r(r_command)
-        r_result = droma_state.r('result')
-        
-        # Convert result to Python
-        python_result = _convert_r_to_python(r_result)
-        
-        # Cache the result
         cache_key = f"multi_treatment_response_{request.multidromaset_id}"
-        droma_state.cache_data(cache_key, python_result, {
-            "drugs": request.drugs,
-            "zscore_normalized": request.zscore,
-            "overlap_only": request.overlap_only,
-            "data_type": request.data_type.value,
-            "tumor_type": request.tumor_type
-        })
-        
-        # Get basic stats for multi-project data
-        if isinstance(python_result, list):
-            project_stats = {}
-            for i, data in enumerate(python_result):
-                if isinstance(data, pd.DataFrame):
-                    project_name = f"project_{i+1}"  # or get actual project names if available
-                    project_stats[project_name] = {
-                        "shape": data.shape,
-                        "drugs_count": len(data.index),
-                        "samples_count": len(data.columns)
-                    }
-            stats = {"projects": project_stats, "total_projects": len(python_result)}
-        else:
-            stats = {"result_type": "unknown"}
+        stats = await _run_r_loader(
+            droma_state, 'loadMultiProjectTreatmentResponseNormalized', multidataset_r_name,
+            {
+                "drugs": request.drugs,
+                "overlap_only": request.overlap_only,
+                "data_type": request.data_type.value,
+                "tumor_type": request.tumor_type,
+                "zscore": request.zscore
+            },
+            cache_key,
+            {
+                "drugs": request.drugs,
+                "zscore_normalized": request.zscore,
+                "overlap_only": request.overlap_only,
+                "data_type": request.data_type.value,
+                "tumor_type": request.tumor_type
+            },
+            count_label="drugs_count",
+            multi_project=True
+        )
         
         await ctx.info(f"Successfully loaded multi-project treatment response: {stats}")
         
@@ -408,7 +535,7 @@ async def load_multi_project_treatment_response_normalized(
             "stats": stats,
             "message": f"Loaded multi-project treatment response data"
         }
-        
+    
     except Exception as e:
         await ctx.error(f"Error loading multi-project treatment response: {str(e)}")
         return {
@@ -420,18 +547,22 @@ async def load_multi_project_treatment_response_normalized(
 @data_loading_mcp.tool()
 async def check_zscore_normalization(
     ctx: Context,
-    cache_key: str
+    cache_key: str,
+    full_scan: bool = False
 ) -> Dict[str, Any]:
     """
     Check if cached data has been z-score normalized.
     
+    Statistics are estimated from a fixed-seed sample of cells for large
+    matrices unless full_scan is set.
+    
     Equivalent to R function: isZscoreNormalized()
     """
     # Get DROMA state
     droma_state = ctx.request_context.lifespan_context
     
     cached_data = droma_state.get_cached_data(cache_key)
-    if not cached_data:
+    if cached_data is None:
         return {
             "status": "error",
             "message": f"No cached data found for key: {cache_key}"
@@ -440,27 +571,59 @@ async def check_zscore_normalization(
     try:
         # Check if data has normalization metadata
         cached_entry = droma_state.data_cache[cache_key]
-        metadata = cached_entry.get('metadata', {})
+        metadata = cached_entry.metadata
         
         is_normalized = metadata.get('zscore_normalized', False)
         
         # Additional validation for pandas DataFrames
-        data = cached_entry['data']
+        data = cached_entry.data
         validation_info = {}
         
         if isinstance(data, pd.DataFrame):
+            # Reduce the matrix once per statistic and derive the checks from
+            # those scalars instead of rescanning it for each one
+            values = data.to_numpy().ravel()
+            sampled = not full_scan and values.size > _ZSCORE_SAMPLE_SIZE
+            if sampled:
+                rng = np.random.default_rng(0)
+                values = values[rng.integers(0, values.size, _ZSCORE_SAMPLE_SIZE)]
+            
+            # Skip missing cells and use the sample standard deviation, as
+            # the R statistics of a stats_only load do
+            mean = float(np.nanmean(values))
+            std = float(np.nanstd(values, ddof=1))
+            min_value = float(np.nanmin(values))
+            max_value = float(np.nanmax(values))
+            
             # Check data characteristics
             validation_info = {
                 "data_type": "DataFrame",
                 "shape": data.shape,
-                "mean_close_to_zero": abs(data.values.mean()) < 0.1,
-                "std_close_to_one": abs(data.values.std() - 1.0) < 0.1,
-                "has_negative_values": (data.values < 0).any(),
+                "mean_close_to_zero": abs(mean) < 0.1,
+                "std_close_to_one": abs(std - 1.0) < 0.1,
+                "has_negative_values": min_value < 0,
+                "sampled": sampled,
                 "sample_statistics": {
-                    "mean": float(data.values.mean()),
-                    "std": float(data.values.std()),
-                    "min": float(data.values.min()),
-                    "max": float(data.values.max())
+                    "mean": mean,
+                    "std": std,
+                    "min": min_value,
+                    "max": max_value
+                }
+            }
+        elif metadata.get('stats_only'):
+            # Statistics were computed in R at load time over every cell
+            validation_info = {
+                "data_type": "stats_only",
+                "shape": data["shape"],
+                "mean_close_to_zero": abs(data["mean"]) < 0.1,
+                "std_close_to_one": abs(data["sd"] - 1.0) < 0.1,
+                "has_negative_values": data["min"] < 0,
+                "sampled": False,
+                "sample_statistics": {
+                    "mean": data["mean"],
+                    "std": data["sd"],
+                    "min": data["min"],
+                    "max": data["max"]
                 }
             }
         
@@ -486,6 +649,8 @@ async def get_cached_data_info(
     cache_key: Optional[str] = None
 ) -> Dict[str, Any]:
     """Get information about cached data."""
+    from ..util import format_data_size
+    
     # Get DROMA state
     droma_state = ctx.request_context.lifespan_context
     
@@ -498,15 +663,16 @@ async def get_cached_data_info(
                 "message": f"No cached data found for key: {cache_key}"
             }
         
-        data = cached_entry['data']
-        metadata = cached_entry.get('metadata', {})
-        timestamp = cached_entry.get('timestamp')
+        data = cached_entry.data
+        metadata = cached_entry.metadata
+        timestamp = cached_entry.timestamp
         
         data_info = {
             "cache_key": cache_key,
-            "timestamp": str(timestamp),
+            "timestamp": _format_timestamp(timestamp),
             "metadata": metadata,
-            "data_type": str(type(data)),
+            "data_type": cached_entry.summary['data_type'],
+            "size": format_data_size(cached_entry.nbytes),
         }
         
         if isinstance(data, pd.DataFrame):
@@ -525,15 +691,18 @@ async def get_cached_data_info(
         cache_summary = {}
         for key, entry in droma_state.data_cache.items():
             cache_summary[key] = {
-                "timestamp": str(entry.get('timestamp')),
-                "data_type": str(type(entry['data'])),
-                "metadata": entry.get('metadata', {})
+                "timestamp": _format_timestamp(entry.timestamp),
+                **entry.summary,
+                "metadata": entry.metadata,
+                "size": format_data_size(entry.nbytes)
             }
         
         return {
             "status": "success",
             "cached_items": cache_summary,
-            "total_items": len(cache_summary)
+            "total_items": len(cache_summary),
+            "total_bytes": droma_state.cache_bytes,
+            "total_size": format_data_size(droma_state.cache_bytes)
         }
 
 
@@ -544,12 +713,18 @@ async def export_cached_data(
     file_format: str = "csv",
     filename: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Export cached data to file."""
+    """
+    Export cached data to file.
+    
+    Supported formats are csv, excel, json, parquet and feather; the binary
+    parquet/feather formats are much faster for large matrices but require
+    pyarrow.
+    """
     # Get DROMA state
     droma_state = ctx.request_context.lifespan_context
     
     cached_data = droma_state.get_cached_data(cache_key)
-    if not cached_data:
+    if cached_data is None:
         return {
             "status": "error",
             "message": f"No cached data found for key: {cache_key}"
@@ -560,7 +735,8 @@ async def export_cached_data(
         from ..util import save_analysis_result
         
         if isinstance(cached_data, pd.DataFrame):
-            export_id = save_analysis_result(cached_data, filename, file_format)
+            # Write the file in a worker thread so the event loop keeps serving requests
+            export_id = await asyncio.to_thread(save_analysis_result, cached_data, filename, file_format)
             
             return {
                 "status": "success",
@@ -1,11 +1,21 @@
 """DROMA MCP server for database query and exploration operations."""
 
-from fastmcp import FastMCP, Context
-from typing import Dict, Any
+import asyncio
+import base64
+import functools
+import io
+import os
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
+from fastmcp import FastMCP, Context
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
 
 from ..schema.database_query import (
+    AnnoType,
+    AnnotationFormat,
     GetAnnotationModel,
     ListSamplesModel,
     ListFeaturesModel,
@@ -15,11 +25,64 @@ from ..schema.database_query import (
 # Create sub-MCP server for database queries
 database_query_mcp = FastMCP("DROMA-Database-Query")
 
+# Idle connections kept open per database file
+_POOL_SIZE = 8
+
+_pools: Dict[str, queue.LifoQueue] = {}
+_pools_lock = threading.Lock()
+
+# Default number of annotation rows returned per page by the chunked tool
+_ANNOTATION_CHUNK_SIZE = 10_000
+
+# Caps the worker threads running queries at the number of pooled connections
+_query_slots = asyncio.Semaphore(_POOL_SIZE)
+
+
+async def _run_query(func, *args) -> Any:
+    """Run a blocking query function in a worker thread holding one query slot."""
+    async with _query_slots:
+        return await asyncio.to_thread(func, *args)
+
+
+# Tables that hold annotations or metadata rather than project data
+_NON_PROJECT_TABLES = frozenset({"sample_anno", "drug_anno", "droma_metadata", "search_vectors"})
+
+# Characters that make a pattern more than a literal string
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+# Folds ASCII letters only, like SQLite's NOCASE collation and LIKE
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+# Regex wildcards and their SQL LIKE equivalents
+_LIKE_WILDCARDS = str.maketrans({"*": "%", ".": "_"})
+
+# Known data sources: True if samples are values of a cells column, False if
+# samples are the table's columns next to feature_id
+_DISCRETE_DATA_SOURCES = {
+    "mRNA": False, "cnv": False, "meth": False, "proteinrppa": False, "proteinms": False,
+    "drug": False, "drug_raw": False,
+    "mutation_gene": True, "mutation_site": True, "fusion": True
+}
+
+# Per database file: (mtime_ns, {table name: column names, or None until first needed})
+_schema_cache: Dict[str, Tuple[int, Dict[str, Optional[List[str]]]]] = {}
+
+# Per (database file, table): (mtime_ns, row count)
+_row_count_cache: Dict[Tuple[str, str], Tuple[int, int]] = {}
+
+# Per database file: (mtime_ns, {project inferred from table names: data types})
+_inferred_projects_cache: Dict[str, Tuple[int, Dict[str, List[str]]]] = {}
+
+
+class _DatabaseConnection(sqlite3.Connection):
+    """SQLite connection that remembers the database file it was opened on."""
+    
+    db_path: str
+
 
-def _get_database_connection(droma_state) -> sqlite3.Connection:
-    """Get database connection from DROMA state."""
+def _get_database_path() -> str:
+    """Get the configured database path, checking that the file exists."""
     # Check if we have a database path in environment or state
-    import os
     db_path = os.environ.get('DROMA_DB_PATH')
     
     if not db_path:
@@ -28,8 +91,23 @@ def _get_database_connection(droma_state) -> sqlite3.Connection:
     if not Path(db_path).exists():
         raise RuntimeError(f"Database file not found: {db_path}")
     
+    return db_path
+
+
+def _get_database_connection(db_path: str) -> sqlite3.Connection:
+    """Open a new read-only database connection tuned for repeated reads."""
     try:
-        conn = sqlite3.connect(db_path)
+        # The tools only read, so open read-only in autocommit mode; pooled
+        # connections may be reused from other threads
+        conn = sqlite3.connect(
+            f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False,
+            factory=_DatabaseConnection, cached_statements=256, isolation_level=None
+        )
+        conn.db_path = db_path
+        # Read through a 256 MiB memory map with a 64 MiB page cache
+        conn.executescript(
+            "PRAGMA mmap_size=268435456; PRAGMA cache_size=-65536; PRAGMA temp_store=MEMORY;"
+        )
         # Enable row factory for easier data access
         conn.row_factory = sqlite3.Row
         return conn
@@ -37,95 +115,329 @@ def _get_database_connection(droma_state) -> sqlite3.Connection:
         raise RuntimeError(f"Failed to connect to database: {e}")
 
 
-@database_query_mcp.tool()
-async def get_droma_annotation(
-    ctx: Context,
-    request: GetAnnotationModel
-) -> Dict[str, Any]:
+@contextmanager
+def _pooled_connection() -> Iterator[sqlite3.Connection]:
+    """Check a database connection out of the per-file pool for a block.
+    
+    Connections are opened on demand and returned to the pool afterwards, so
+    repeated tool calls skip the connect and schema parse.
     """
-    Retrieve annotation data from either sample_anno or drug_anno tables.
+    db_path = _get_database_path()
+    with _pools_lock:
+        pool = _pools.setdefault(db_path, queue.LifoQueue(maxsize=_POOL_SIZE))
     
-    Equivalent to R function: getDROMAAnnotation()
+    try:
+        conn = pool.get_nowait()
+    except queue.Empty:
+        conn = _get_database_connection(db_path)
+    
+    try:
+        yield conn
+    finally:
+        try:
+            pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
+def _get_tables(conn: _DatabaseConnection) -> Dict[str, Optional[List[str]]]:
+    """Get the database's tables, scanning sqlite_master only when the file changes."""
+    mtime = os.stat(conn.db_path).st_mtime_ns
+    cached = _schema_cache.get(conn.db_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    names = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")]
+    tables = dict.fromkeys(names)
+    _schema_cache[conn.db_path] = (mtime, tables)
+    return tables
+
+
+def _get_columns(conn: _DatabaseConnection, table_name: str) -> List[str]:
+    """Get a table's column names, running PRAGMA table_info once per table."""
+    tables = _get_tables(conn)
+    columns = tables[table_name]
+    if columns is None:
+        columns = [row[1] for row in conn.execute(f'PRAGMA table_info("{table_name}")')]
+        tables[table_name] = columns
+    return columns
+
+
+def _get_inferred_projects(conn: _DatabaseConnection) -> Dict[str, List[str]]:
+    """Get projects and their data types from table names, parsing them once per file change."""
+    mtime = os.stat(conn.db_path).st_mtime_ns
+    cached = _inferred_projects_cache.get(conn.db_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    # Data tables are named <project>_<data type>
+    projects: Dict[str, List[str]] = {}
+    for table in _get_tables(conn):
+        if "_" in table and table not in _NON_PROJECT_TABLES and not _is_search_index(table):
+            project_name, _, data_type = table.partition("_")
+            projects.setdefault(project_name, []).append(data_type)
+    
+    projects = {name: sorted(projects[name]) for name in sorted(projects)}
+    _inferred_projects_cache[conn.db_path] = (mtime, projects)
+    return projects
+
+
+def _cached_row_count(conn: _DatabaseConnection, table_name: str) -> Optional[int]:
+    """Get a table's row count if it was counted since the file last changed."""
+    cached = _row_count_cache.get((conn.db_path, table_name))
+    if cached is not None and cached[0] == os.stat(conn.db_path).st_mtime_ns:
+        return cached[1]
+    return None
+
+
+def _cache_row_count(conn: _DatabaseConnection, table_name: str, count: int) -> None:
+    """Remember a table's row count until the database file changes."""
+    _row_count_cache[(conn.db_path, table_name)] = (os.stat(conn.db_path).st_mtime_ns, count)
+
+
+def _is_search_index(table_name: str) -> bool:
+    """Check whether a table is an FTS5 search index or one of its shadow tables."""
+    return table_name.endswith("_fts") or "_fts_" in table_name
+
+
+def _get_project_tables(conn: _DatabaseConnection, project_name: str) -> List[str]:
+    """Get the names of a project's data tables."""
+    prefix = f"{project_name}_"
+    return [name for name in _get_tables(conn) if name.startswith(prefix) and not _is_search_index(name)]
+
+
+def _annotation_table(request: GetAnnotationModel) -> str:
+    """Get the annotation table a request reads from."""
+    return "sample_anno" if request.anno_type is AnnoType.SAMPLE else "drug_anno"
+
+
+def _indexed_pattern_condition(
+    conn: _DatabaseConnection, table_name: str, column: str, pattern: str
+) -> Optional[Tuple[str, List[Any]]]:
+    """Get an index-friendly SQL condition for a literal regex pattern, if there is one.
+    
+    An anchored literal prefix ("^abc") becomes a NOCASE range on the
+    column, which matches the same rows as LIKE 'abc%' (ASCII letters
+    case-insensitively) and can seek a COLLATE NOCASE index. An unanchored
+    ASCII literal of at least three characters, with no LIKE wildcards, is
+    looked up in a "<table>_fts" FTS5 table when the database has one.
+    Create it with, for example:
+    
+        CREATE VIRTUAL TABLE sample_anno_fts USING fts5(
+            SampleID, content='sample_anno', tokenize='trigram');
+        INSERT INTO sample_anno_fts(sample_anno_fts) VALUES ('rebuild');
+    
+    Returns None when the pattern needs the LIKE fallback.
     """
-    # Get DROMA state
-    droma_state = ctx.request_context.lifespan_context
+    if pattern.startswith("^") and not pattern.endswith("$"):
+        prefix = pattern[1:]
+        bounds = _nocase_prefix_bounds(prefix)
+        if bounds is not None:
+            return f" AND {column} COLLATE NOCASE >= ? AND {column} COLLATE NOCASE < ?", list(bounds)
+    elif (
+        len(pattern) >= 3
+        and pattern.isascii()
+        and not _REGEX_METACHARACTERS.intersection(pattern)
+        and "%" not in pattern and "_" not in pattern
+        and f"{table_name}_fts" in _get_tables(conn)
+    ):
+        # For ASCII patterns without LIKE wildcards the trigram tokenizer
+        # matches the same substrings as LIKE; it also folds non-ASCII case,
+        # which LIKE does not, so other patterns take the LIKE fallback
+        fts_table = f"{table_name}_fts"
+        phrase = '"' + pattern.replace('"', '""') + '"'
+        return f' AND rowid IN (SELECT rowid FROM "{fts_table}" WHERE "{fts_table}" MATCH ?)', [phrase]
+    return None
+
+
+def _nocase_prefix_bounds(prefix: str) -> Optional[Tuple[str, str]]:
+    """Get NOCASE range bounds matching the strings LIKE 'prefix%' matches, if there are any.
+    
+    Returns None when the prefix holds regex or LIKE wildcards, or when the
+    bound past it cannot be formed (its last character would be U+10FFFF, a
+    surrogate, or an uppercase letter that NOCASE folds back into the range).
+    """
+    if not prefix or _REGEX_METACHARACTERS.intersection(prefix) or "%" in prefix or "_" in prefix:
+        return None
+    # NOCASE folds only ASCII letters, as LIKE does, so compare folded strings
+    lower = prefix.translate(_ASCII_LOWER)
+    next_code = ord(lower[-1]) + 1
+    if next_code > 0x10FFFF or 0xD800 <= next_code <= 0xDFFF or 0x41 <= next_code <= 0x5A:
+        return None
+    return lower, lower[:-1] + chr(next_code)
+
+
+@functools.lru_cache(maxsize=512)
+def _regex_to_like(pattern: str) -> str:
+    """Translate a basic regex pattern (^, $, *, .) to a SQL LIKE pattern."""
+    anchored_start = pattern.startswith("^")
+    anchored_end = pattern.endswith("$")
+    body = pattern[anchored_start:len(pattern) - anchored_end]
+    like_pattern = f"{'' if anchored_start else '%'}{body}{'' if anchored_end else '%'}"
     
+    # Replace regex wildcards with SQL wildcards
+    return like_pattern.translate(_LIKE_WILDCARDS)
+
+
+def _encode_arrow(columns: List[str], rows: List[sqlite3.Row], output_format: AnnotationFormat) -> str:
+    """Encode rows as a base64 Arrow IPC stream or Parquet file (needs pyarrow)."""
     try:
-        # Get database connection
-        conn = _get_database_connection(droma_state)
-        
-        # Determine table name and ID column
-        if request.anno_type == "sample":
-            table_name = "sample_anno"
-            id_column = "SampleID"
-            project_column = "ProjectID"
-        else:
-            table_name = "drug_anno"  
-            id_column = "DrugName"
-            project_column = "ProjectID"
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError(
+            f"The '{output_format.value}' output format needs pyarrow (pip install 'droma-mcp[arrow]')"
+        )
+    
+    # Build each column array straight from the rows, skipping per-row dicts
+    width = len(columns)
+    values = list(zip(*(row[:width] for row in rows))) or [()] * width
+    table = pa.Table.from_arrays([pa.array(column) for column in values], names=columns)
+    
+    buffer = io.BytesIO()
+    if output_format is AnnotationFormat.PARQUET:
+        pq.write_table(table, buffer, compression='zstd')
+    else:
+        with pa.ipc.new_stream(buffer, table.schema) as writer:
+            writer.write_table(table)
+    return base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def _format_rows(
+    columns: List[str], rows: List[sqlite3.Row], output_format: AnnotationFormat
+) -> Union[List[Dict[str, Any]], Dict[str, list], str]:
+    """Lay out annotation rows as records, columns plus row values, or encoded Arrow/Parquet."""
+    if output_format in (AnnotationFormat.ARROW, AnnotationFormat.PARQUET):
+        return _encode_arrow(columns, rows, output_format)
+    if output_format is AnnotationFormat.COLUMNAR:
+        # Column names appear once instead of being repeated in every row
+        width = len(columns)
+        return {"columns": columns, "rows": [list(row[:width]) for row in rows]}
+    # sqlite3.Row already maps column names to values
+    records = [dict(row) for row in rows]
+    if rows and len(rows[0]) > len(columns):
+        for record in records:
+            del record["_total"]
+    return records
+
+
+@functools.lru_cache(maxsize=256)
+def _annotation_query_template(
+    anno_type: AnnoType,
+    select: str,
+    has_project: bool,
+    id_count: int,
+    has_data_type: bool,
+    has_tumor_type: bool
+) -> str:
+    """Build the ordered annotation SQL for one combination of filters, without a LIMIT."""
+    # Determine table name and ID column
+    if anno_type is AnnoType.SAMPLE:
+        table_name = "sample_anno"
+        id_column = "SampleID"
+    else:
+        table_name = "drug_anno"
+        id_column = "DrugName"
+    project_column = "ProjectID"
+    
+    # Build query
+    query = f"{select} FROM {table_name} WHERE 1=1"
+    
+    # Add project filter
+    if has_project:
+        query += f" AND {project_column} = ?"
+    
+    # Add ID filter
+    if id_count > 0:
+        placeholders = ",".join(["?"] * id_count)
+        query += f" AND {id_column} IN ({placeholders})"
+    
+    # Add sample-specific filters
+    if has_data_type:
+        query += " AND DataType = ?"
+    
+    if has_tumor_type:
+        query += " AND TumorType = ?"
+    
+    # Add ordering
+    return query + f" ORDER BY {id_column}"
+
+
+def _build_annotation_query(request: GetAnnotationModel, select: str) -> Tuple[str, List[Any]]:
+    """Get the ordered annotation query and its parameters for a request, without a LIMIT."""
+    is_sample = request.anno_type is AnnoType.SAMPLE
+    has_data_type = is_sample and request.data_type.value != "all"
+    has_tumor_type = is_sample and request.tumor_type != "all"
+    
+    params = []
+    if request.project_name:
+        params.append(request.project_name)
+    if request.ids:
+        params.extend(request.ids)
+    if has_data_type:
+        params.append(request.data_type.value)
+    if has_tumor_type:
+        params.append(request.tumor_type)
+    
+    query = _annotation_query_template(
+        request.anno_type, select, bool(request.project_name),
+        len(request.ids or ()), has_data_type, has_tumor_type
+    )
+    return query, params
+
+
+def _query_annotation(request: GetAnnotationModel) -> Dict[str, Any]:
+    """Run get_droma_annotation's queries on a pooled connection."""
+    # Check a database connection out of the pool
+    with _pooled_connection() as conn:
+        table_name = _annotation_table(request)
         
         # Check if table exists
-        cursor = conn.cursor()
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table_name,))
-        if not cursor.fetchone():
-            conn.close()
+        if table_name not in _get_tables(conn):
             return {
                 "status": "error",
                 "message": f"Annotation table '{table_name}' not found in database"
             }
         
-        # Build query
-        query = f"SELECT * FROM {table_name} WHERE 1=1"
-        params = []
-        
-        # Add project filter
-        if request.project_name:
-            query += f" AND {project_column} = ?"
-            params.append(request.project_name)
-        
-        # Add ID filter
-        if request.ids and len(request.ids) > 0:
-            placeholders = ",".join(["?" for _ in request.ids])
-            query += f" AND {id_column} IN ({placeholders})"
-            params.extend(request.ids)
+        # Reuse the table total from an earlier call when it is still valid
+        total_records = _cached_row_count(conn, table_name) if request.include_total else None
         
-        # Add sample-specific filters
-        if request.anno_type == "sample":
-            if request.data_type.value != "all":
-                query += " AND DataType = ?"
-                params.append(request.data_type.value)
-            
-            if request.tumor_type != "all":
-                query += " AND TumorType = ?"
-                params.append(request.tumor_type)
+        # Without filters the table total is the result's own row count, so
+        # compute it in the same pass with a window function
+        unfiltered = not (request.project_name or request.ids or (
+            request.anno_type is AnnoType.SAMPLE
+            and (request.data_type.value != "all" or request.tumor_type != "all")
+        ))
+        count_in_query = unfiltered and request.include_total and total_records is None
         
-        # Add ordering
-        query += f" ORDER BY {id_column}"
+        # Build query
+        select = "SELECT *, COUNT(*) OVER () AS _total" if count_in_query else "SELECT *"
+        query, params = _build_annotation_query(request, select)
         
         # Add limit if specified
         if request.limit and request.limit > 0:
             query += " LIMIT ?"
             params.append(request.limit)
         
-        await ctx.info(f"Executing query for {request.anno_type} annotations")
-        
         # Execute query
-        cursor.execute(query, params)
+        cursor = conn.execute(query, params)
         rows = cursor.fetchall()
         
-        # Convert to list of dictionaries
-        result_data = []
-        if rows:
-            columns = [description[0] for description in cursor.description]
-            for row in rows:
-                result_data.append(dict(zip(columns, row)))
+        # Convert to the requested layout
+        columns = [description[0] for description in cursor.description]
+        if count_in_query:
+            # Leave out the trailing _total column
+            columns = columns[:-1]
+        result_data = _format_rows(columns, rows, request.output_format)
         
         # Get total count for summary
-        total_query = f"SELECT COUNT(*) FROM {table_name}"
-        cursor.execute(total_query)
-        total_records = cursor.fetchone()[0]
-        
-        conn.close()
+        if count_in_query:
+            total_records = rows[0]["_total"] if rows else 0
+            _cache_row_count(conn, table_name, total_records)
+        elif request.include_total and total_records is None:
+            total_query = f"SELECT COUNT(*) FROM {table_name}"
+            total_records = conn.execute(total_query).fetchone()[0]
+            _cache_row_count(conn, table_name, total_records)
         
         # Prepare filter description for logging
         filters = []
@@ -133,7 +445,7 @@ async def get_droma_annotation(
             filters.append(f"project='{request.project_name}'")
         if request.ids:
             filters.append(f"specific IDs ({len(request.ids)} requested)")
-        if request.anno_type == "sample":
+        if request.anno_type is AnnoType.SAMPLE:
             if request.data_type.value != "all":
                 filters.append(f"data_type='{request.data_type.value}'")
             if request.tumor_type != "all":
@@ -141,112 +453,222 @@ async def get_droma_annotation(
         
         filter_desc = f" (filtered by {', '.join(filters)})" if filters else ""
         
-        if request.limit:
-            message = f"Retrieved first {len(result_data)} {request.anno_type} annotations out of {total_records} total records{filter_desc}"
+        if request.limit and total_records is not None:
+            message = f"Retrieved first {len(rows)} {request.anno_type.value} annotations out of {total_records} total records{filter_desc}"
+        elif request.limit:
+            message = f"Retrieved first {len(rows)} {request.anno_type.value} annotations{filter_desc}"
         else:
-            message = f"Retrieved {len(result_data)} {request.anno_type} annotations{filter_desc}"
-        
-        await ctx.info(message)
+            message = f"Retrieved {len(rows)} {request.anno_type.value} annotations{filter_desc}"
         
         return {
             "status": "success",
-            "annotation_type": request.anno_type,
+            "annotation_type": request.anno_type.value,
             "data": result_data,
-            "total_records": len(result_data),
+            "total_records": len(rows),
             "total_in_database": total_records,
             "message": message
         }
+
+
+@database_query_mcp.tool()
+async def get_droma_annotation(
+    ctx: Context,
+    request: GetAnnotationModel
+) -> Dict[str, Any]:
+    """
+    Retrieve annotation data from either sample_anno or drug_anno tables.
+    
+    Equivalent to R function: getDROMAAnnotation()
+    """
+    
+    try:
+        await ctx.info(f"Executing query for {request.anno_type.value} annotations")
+        
+        # Run the blocking SQLite work in a worker thread, at most one per pooled connection
+        result = await _run_query(_query_annotation, request)
         
+        if result["status"] == "success":
+            await ctx.info(result["message"])
+        return result
+    
     except Exception as e:
-        await ctx.error(f"Error retrieving {request.anno_type} annotations: {str(e)}")
+        await ctx.error(f"Error retrieving {request.anno_type.value} annotations: {str(e)}")
         return {
             "status": "error",
-            "message": f"Failed to retrieve {request.anno_type} annotations: {str(e)}"
+            "message": f"Failed to retrieve {request.anno_type.value} annotations: {str(e)}"
+        }
+
+
+def _query_annotation_chunk(request: GetAnnotationModel, offset: int, chunk_size: int) -> Dict[str, Any]:
+    """Run get_droma_annotation_chunked's page query on a pooled connection."""
+    # Check a database connection out of the pool
+    with _pooled_connection() as conn:
+        table_name = _annotation_table(request)
+        
+        # Check if table exists
+        if table_name not in _get_tables(conn):
+            return {
+                "status": "error",
+                "message": f"Annotation table '{table_name}' not found in database"
+            }
+        
+        # request.limit caps the rows returned across all pages
+        page_size = chunk_size
+        if request.limit and request.limit > 0:
+            page_size = max(0, min(chunk_size, request.limit - offset))
+        
+        query, params = _build_annotation_query(request, "SELECT *")
+        query += " LIMIT ? OFFSET ?"
+        params.extend([page_size, offset])
+        
+        cursor = conn.execute(query, params)
+        rows = cursor.fetchall()
+        columns = [description[0] for description in cursor.description]
+        result_data = _format_rows(columns, rows, request.output_format)
+        
+        end = offset + len(rows)
+        has_more = page_size > 0 and len(rows) == page_size and not (
+            request.limit and request.limit > 0 and end >= request.limit
+        )
+        
+        return {
+            "status": "success",
+            "annotation_type": request.anno_type.value,
+            "data": result_data,
+            "offset": offset,
+            "next_offset": end if has_more else None,
+            "message": f"Retrieved {request.anno_type.value} annotations {offset} to {end}"
         }
 
 
 @database_query_mcp.tool()
-async def list_droma_samples(
+async def get_droma_annotation_chunked(
     ctx: Context,
-    request: ListSamplesModel
+    request: GetAnnotationModel,
+    offset: int = 0,
+    chunk_size: int = _ANNOTATION_CHUNK_SIZE
 ) -> Dict[str, Any]:
     """
-    List all available samples for a specific project with optional filters.
+    Retrieve annotation data one page at a time.
     
-    Equivalent to R function: listDROMASamples()
+    Returns up to chunk_size rows starting at offset, in the same order as
+    get_droma_annotation, plus the next_offset to request (None after the
+    last page). Use it for annotation tables too large for a single response.
     """
-    # Get DROMA state
-    droma_state = ctx.request_context.lifespan_context
+    if offset < 0 or chunk_size <= 0:
+        return {
+            "status": "error",
+            "message": "offset must be >= 0 and chunk_size must be > 0"
+        }
     
     try:
-        # Get database connection
-        conn = _get_database_connection(droma_state)
-        cursor = conn.cursor()
+        # Run the blocking SQLite work in a worker thread, at most one per pooled connection
+        result = await _run_query(_query_annotation_chunk, request, offset, chunk_size)
         
+        if result["status"] == "success":
+            await ctx.info(result["message"])
+        return result
+    
+    except Exception as e:
+        await ctx.error(f"Error retrieving {request.anno_type.value} annotations: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to retrieve {request.anno_type.value} annotations: {str(e)}"
+        }
+
+
+def _has_sample_filters(request: ListSamplesModel) -> bool:
+    """Check whether a samples request narrows the project's samples."""
+    return (
+        request.data_type.value != "all" or request.tumor_type != "all"
+        or request.data_sources != "all" or bool(request.pattern)
+    )
+
+
+def _count_project_samples(project_name: str) -> Optional[int]:
+    """Count a project's distinct samples on a pooled connection.
+    
+    Returns None if the database has no sample_anno table; _query_samples
+    reports that error.
+    """
+    with _pooled_connection() as conn:
+        if "sample_anno" not in _get_tables(conn):
+            return None
+        total_query = "SELECT COUNT(DISTINCT SampleID) FROM sample_anno WHERE ProjectID = ?"
+        return conn.execute(total_query, [project_name]).fetchone()[0]
+
+
+def _query_samples(request: ListSamplesModel) -> Dict[str, Any]:
+    """Run list_droma_samples's sample query on a pooled connection.
+    
+    The project total is only filled in for unfiltered requests; filtered
+    requests count it separately with _count_project_samples.
+    """
+    # Check a database connection out of the pool
+    with _pooled_connection() as conn:
         # Check if sample_anno table exists
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='sample_anno'")
-        if not cursor.fetchone():
-            conn.close()
+        if "sample_anno" not in _get_tables(conn):
             return {
                 "status": "error",
                 "message": "Sample annotation table 'sample_anno' not found in database"
             }
         
         # Get samples with data_sources filter if specified
-        filtered_samples_by_data = None
+        data_source_condition = None
         if request.data_sources != "all":
             data_table_name = f"{request.project_name}_{request.data_sources}"
             
             # Check if the data source table exists
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (data_table_name,))
-            if not cursor.fetchone():
+            if data_table_name not in _get_tables(conn):
                 # Get available tables for this project
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name LIKE ?", 
-                             (f"{request.project_name}_%",))
-                available_tables = [row[0] for row in cursor.fetchall()]
+                available_tables = _get_project_tables(conn, request.project_name)
                 
-                conn.close()
                 return {
                     "status": "error",
                     "message": f"Data source table '{data_table_name}' not found. Available tables: {', '.join(available_tables)}"
                 }
             
-            # Get samples that have data in this data source
-            if request.data_sources in ["mRNA", "cnv", "meth", "proteinrppa", "proteinms", "drug", "drug_raw"]:
-                # For continuous data, get column names (excluding feature_id)
-                cursor.execute(f"PRAGMA table_info({data_table_name})")
-                columns_info = cursor.fetchall()
-                filtered_samples_by_data = [row[1] for row in columns_info if row[1] != "feature_id"]
-            elif request.data_sources in ["mutation_gene", "mutation_site", "fusion"]:
-                # For discrete data, get unique values from cells column
-                cursor.execute(f"SELECT DISTINCT cells FROM {data_table_name} WHERE cells IS NOT NULL")
-                discrete_result = cursor.fetchall()
-                filtered_samples_by_data = [row[0] for row in discrete_result]
-            else:
+            # Determine how this data source records its samples
+            discrete = _DISCRETE_DATA_SOURCES.get(request.data_sources)
+            if discrete is None:
                 # Try to detect automatically
-                cursor.execute(f"PRAGMA table_info({data_table_name})")
-                columns_info = cursor.fetchall()
-                column_names = [row[1] for row in columns_info]
-                
-                if "cells" in column_names:
-                    # Discrete data
-                    cursor.execute(f"SELECT DISTINCT cells FROM {data_table_name} WHERE cells IS NOT NULL")
-                    discrete_result = cursor.fetchall()
-                    filtered_samples_by_data = [row[0] for row in discrete_result]
-                else:
-                    # Continuous data
-                    filtered_samples_by_data = [name for name in column_names if name != "feature_id"]
+                discrete = "cells" in _get_columns(conn, data_table_name)
+            
+            # Restrict to samples that have data in this data source with a
+            # subquery, so SQLite intersects the sets instead of binding every ID
+            if discrete:
+                # For discrete data, samples are the values of the cells column
+                has_samples = conn.execute(
+                    f"SELECT 1 FROM {data_table_name} WHERE cells IS NOT NULL LIMIT 1"
+                ).fetchone() is not None
+                data_source_condition = (
+                    f" AND SampleID IN (SELECT cells FROM {data_table_name} WHERE cells IS NOT NULL)", []
+                )
+            else:
+                # For continuous data, samples are the column names (excluding
+                # feature_id), already held in the schema cache
+                has_samples = any(name != "feature_id" for name in _get_columns(conn, data_table_name))
+                data_source_condition = (
+                    " AND SampleID IN (SELECT name FROM pragma_table_info(?) WHERE name != 'feature_id')",
+                    [data_table_name]
+                )
             
-            if len(filtered_samples_by_data) == 0:
-                conn.close()
+            if not has_samples:
                 return {
                     "status": "warning",
                     "message": f"No samples found with data in '{request.data_sources}' for project '{request.project_name}'",
                     "samples": []
                 }
         
+        # Without filters the project total is the result's own row count, so
+        # compute it in the same pass with a window function over the groups
+        unfiltered = not _has_sample_filters(request)
+        
         # Construct main query
-        query = "SELECT DISTINCT SampleID FROM sample_anno WHERE ProjectID = ?"
+        if unfiltered:
+            query = "SELECT SampleID, COUNT(SampleID) OVER () FROM sample_anno WHERE ProjectID = ? GROUP BY SampleID"
+        else:
+            query = "SELECT DISTINCT SampleID FROM sample_anno WHERE ProjectID = ?"
         params = [request.project_name]
         
         # Add data type filter
@@ -260,37 +682,25 @@ async def list_droma_samples(
             params.append(request.tumor_type)
         
         # Add data sources filter
-        if filtered_samples_by_data is not None:
-            if len(filtered_samples_by_data) > 0:
-                placeholders = ",".join(["?" for _ in filtered_samples_by_data])
-                query += f" AND SampleID IN ({placeholders})"
-                params.extend(filtered_samples_by_data)
-            else:
-                conn.close()
-                return {
-                    "status": "warning",
-                    "message": "No samples with data in the specified data source",
-                    "samples": []
-                }
+        if data_source_condition is not None:
+            condition, condition_params = data_source_condition
+            query += condition
+            params.extend(condition_params)
         
         # Add pattern filter if specified
         if request.pattern:
-            # Convert basic regex patterns to SQL LIKE patterns
-            like_pattern = request.pattern
-            if like_pattern.startswith("^"):
-                like_pattern = like_pattern[1:] + "%"
-            elif like_pattern.endswith("$"):
-                like_pattern = "%" + like_pattern[:-1]
-            elif like_pattern.startswith("^") and like_pattern.endswith("$"):
-                like_pattern = like_pattern[1:-1]
+            # Prefer an index range or FTS5 lookup over a LIKE scan
+            indexed = _indexed_pattern_condition(conn, "sample_anno", "SampleID", request.pattern)
+            if indexed is not None:
+                condition, condition_params = indexed
+                query += condition
+                params.extend(condition_params)
             else:
-                like_pattern = f"%{like_pattern}%"
-            
-            # Replace regex wildcards with SQL wildcards
-            like_pattern = like_pattern.replace("*", "%").replace(".", "_")
-            
-            query += " AND SampleID LIKE ?"
-            params.append(like_pattern)
+                # Convert basic regex patterns to SQL LIKE patterns
+                like_pattern = _regex_to_like(request.pattern)
+                
+                query += " AND SampleID LIKE ?"
+                params.append(like_pattern)
         
         # Add ordering
         query += " ORDER BY SampleID"
@@ -300,112 +710,111 @@ async def list_droma_samples(
             query += " LIMIT ?"
             params.append(request.limit)
         
-        await ctx.info(f"Executing query for samples in project {request.project_name}")
-        
         # Execute query
-        cursor.execute(query, params)
-        sample_rows = cursor.fetchall()
+        sample_rows = conn.execute(query, params).fetchall()
         samples = [row[0] for row in sample_rows]
         
-        # Get total count
-        total_query = "SELECT COUNT(DISTINCT SampleID) FROM sample_anno WHERE ProjectID = ?"
-        cursor.execute(total_query, [request.project_name])
-        total_samples = cursor.fetchone()[0]
-        
-        conn.close()
-        
-        # Prepare filter description
-        filters = []
-        if request.data_type.value != "all":
-            filters.append(f"data_type='{request.data_type.value}'")
-        if request.tumor_type != "all":
-            filters.append(f"tumor_type='{request.tumor_type}'")
-        if request.data_sources != "all":
-            filters.append(f"data_sources='{request.data_sources}'")
-        if request.pattern:
-            filters.append(f"pattern='{request.pattern}'")
-        
-        filter_desc = f" (filtered by {', '.join(filters)})" if filters else ""
-        
-        if request.limit:
-            message = f"Showing first {len(samples)} samples out of {total_samples} total samples for project '{request.project_name}'{filter_desc}"
-        else:
-            if filters or request.data_sources != "all":
-                message = f"Found {len(samples)} samples out of {total_samples} total samples for project '{request.project_name}'{filter_desc}"
-            else:
-                message = f"Found {len(samples)} samples for project '{request.project_name}'{filter_desc}"
-        
-        await ctx.info(message)
-        
         return {
             "status": "success",
             "project_name": request.project_name,
             "samples": samples,
             "total_found": len(samples),
-            "total_in_project": total_samples,
-            "message": message
-        }
-        
-    except Exception as e:
-        await ctx.error(f"Error listing samples for project {request.project_name}: {str(e)}")
-        return {
-            "status": "error",
-            "message": f"Failed to list samples for project {request.project_name}: {str(e)}"
+            "total_in_project": (sample_rows[0][1] if sample_rows else 0) if unfiltered else None
         }
 
 
+def _samples_message(request: ListSamplesModel, samples_count: int, total_samples: int) -> str:
+    """Describe a list_droma_samples result."""
+    # Prepare filter description
+    filters = []
+    if request.data_type.value != "all":
+        filters.append(f"data_type='{request.data_type.value}'")
+    if request.tumor_type != "all":
+        filters.append(f"tumor_type='{request.tumor_type}'")
+    if request.data_sources != "all":
+        filters.append(f"data_sources='{request.data_sources}'")
+    if request.pattern:
+        filters.append(f"pattern='{request.pattern}'")
+    
+    filter_desc = f" (filtered by {', '.join(filters)})" if filters else ""
+    
+    if request.limit:
+        return f"Showing first {samples_count} samples out of {total_samples} total samples for project '{request.project_name}'{filter_desc}"
+    if filters:
+        return f"Found {samples_count} samples out of {total_samples} total samples for project '{request.project_name}'{filter_desc}"
+    return f"Found {samples_count} samples for project '{request.project_name}'{filter_desc}"
+
+
 @database_query_mcp.tool()
-async def list_droma_features(
+async def list_droma_samples(
     ctx: Context,
-    request: ListFeaturesModel
+    request: ListSamplesModel
 ) -> Dict[str, Any]:
     """
-    List all available features (genes, drugs, etc.) for a specific project and data type.
+    List all available samples for a specific project with optional filters.
     
-    Equivalent to R function: listDROMAFeatures()
+    Equivalent to R function: listDROMASamples()
     """
-    # Get DROMA state
-    droma_state = ctx.request_context.lifespan_context
     
     try:
-        # Get database connection
-        conn = _get_database_connection(droma_state)
-        cursor = conn.cursor()
+        await ctx.info(f"Executing query for samples in project {request.project_name}")
+        
+        # Run the blocking SQLite work in worker threads, at most one per pooled connection
+        if _has_sample_filters(request):
+            # The project total ignores the filters, so count it on a second
+            # pooled connection, in its own query slot, while the filtered query runs
+            result, total_samples = await asyncio.gather(
+                _run_query(_query_samples, request),
+                _run_query(_count_project_samples, request.project_name)
+            )
+        else:
+            result = await _run_query(_query_samples, request)
+            total_samples = result.get("total_in_project")
         
+        if result["status"] == "success":
+            result["total_in_project"] = total_samples
+            result["message"] = _samples_message(request, result["total_found"], total_samples)
+            await ctx.info(result["message"])
+        return result
+    
+    except Exception as e:
+        await ctx.error(f"Error listing samples for project {request.project_name}: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to list samples for project {request.project_name}: {str(e)}"
+        }
+
+
+def _query_features(request: ListFeaturesModel) -> Dict[str, Any]:
+    """Run list_droma_features's queries on a pooled connection."""
+    # Check a database connection out of the pool
+    with _pooled_connection() as conn:
         # Construct table name
         table_name = f"{request.project_name}_{request.data_sources}"
         
         # Check if table exists
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table_name,))
-        if not cursor.fetchone():
+        if table_name not in _get_tables(conn):
             # Get available tables for this project
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name LIKE ?", 
-                         (f"{request.project_name}_%",))
-            available_tables = [row[0] for row in cursor.fetchall()]
+            available_tables = _get_project_tables(conn, request.project_name)
             
-            conn.close()
             return {
                 "status": "error",
                 "message": f"Table '{table_name}' not found. Available tables: {', '.join(available_tables)}"
             }
         
         # Determine the feature column name based on data type
-        if request.data_sources in ["mRNA", "cnv", "meth", "proteinrppa", "proteinms", "drug", "drug_raw"]:
-            feature_column = "feature_id"
-        elif request.data_sources in ["mutation_gene", "mutation_site", "fusion"]:
-            feature_column = "genes"
+        discrete = _DISCRETE_DATA_SOURCES.get(request.data_sources)
+        if discrete is not None:
+            feature_column = "genes" if discrete else "feature_id"
         else:
             # Try to detect automatically
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            columns_info = cursor.fetchall()
-            column_names = [row[1] for row in columns_info]
+            column_names = _get_columns(conn, table_name)
             
             if "feature_id" in column_names:
                 feature_column = "feature_id"
             elif "genes" in column_names:
                 feature_column = "genes"
             else:
-                conn.close()
                 return {
                     "status": "error",
                     "message": f"Cannot determine feature column for data type '{request.data_sources}'. Available columns: {', '.join(column_names)}"
@@ -414,28 +823,36 @@ async def list_droma_features(
         # Handle sample filtering for continuous data types
         # Note: This is conceptual since all features exist, but we might want to filter based on sample availability
         
-        # Construct query to get distinct features
-        query = f"SELECT DISTINCT {feature_column} FROM {table_name} WHERE {feature_column} IS NOT NULL"
+        # Construct query to get distinct features along with the table total:
+        # with a pattern the total comes from a scalar subquery that SQLite
+        # runs once, otherwise it is the result's own row count, computed in
+        # the same pass with a window function over the groups
+        if request.pattern:
+            query = (
+                f"SELECT DISTINCT {feature_column}, (SELECT COUNT(DISTINCT {feature_column}) FROM {table_name} "
+                f"WHERE {feature_column} IS NOT NULL) FROM {table_name} WHERE {feature_column} IS NOT NULL"
+            )
+        else:
+            query = (
+                f"SELECT {feature_column}, COUNT(*) OVER () FROM {table_name} "
+                f"WHERE {feature_column} IS NOT NULL GROUP BY {feature_column}"
+            )
         params = []
         
         # Add pattern filter if specified
         if request.pattern:
-            # Convert regex pattern to SQL LIKE pattern
-            like_pattern = request.pattern
-            if like_pattern.startswith("^"):
-                like_pattern = like_pattern[1:] + "%"
-            elif like_pattern.endswith("$"):
-                like_pattern = "%" + like_pattern[:-1]
-            elif like_pattern.startswith("^") and like_pattern.endswith("$"):
-                like_pattern = like_pattern[1:-1]
+            # Prefer an index range or FTS5 lookup over a LIKE scan
+            indexed = _indexed_pattern_condition(conn, table_name, feature_column, request.pattern)
+            if indexed is not None:
+                condition, condition_params = indexed
+                query += condition
+                params.extend(condition_params)
             else:
-                like_pattern = f"%{like_pattern}%"
-            
-            # Replace regex wildcards with SQL wildcards
-            like_pattern = like_pattern.replace("*", "%").replace(".", "_")
-            
-            query += f" AND {feature_column} LIKE ?"
-            params.append(like_pattern)
+                # Convert basic regex patterns to SQL LIKE patterns
+                like_pattern = _regex_to_like(request.pattern)
+                
+                query += f" AND {feature_column} LIKE ?"
+                params.append(like_pattern)
         
         # Add ordering
         query += f" ORDER BY {feature_column}"
@@ -445,19 +862,18 @@ async def list_droma_features(
             query += " LIMIT ?"
             params.append(request.limit)
         
-        await ctx.info(f"Executing query for features in {table_name}")
-        
         # Execute query
-        cursor.execute(query, params)
-        feature_rows = cursor.fetchall()
+        feature_rows = conn.execute(query, params).fetchall()
         features = [row[0] for row in feature_rows]
         
-        # Get total count
-        total_query = f"SELECT COUNT(DISTINCT {feature_column}) FROM {table_name} WHERE {feature_column} IS NOT NULL"
-        cursor.execute(total_query)
-        total_features = cursor.fetchone()[0]
-        
-        conn.close()
+        # Get total count; only a pattern with no matches needs its own query
+        if feature_rows:
+            total_features = feature_rows[0][1]
+        elif request.pattern:
+            total_query = f"SELECT COUNT(DISTINCT {feature_column}) FROM {table_name} WHERE {feature_column} IS NOT NULL"
+            total_features = conn.execute(total_query).fetchone()[0]
+        else:
+            total_features = 0
         
         # Prepare filter description
         filters = []
@@ -477,8 +893,6 @@ async def list_droma_features(
         else:
             message = f"Found {len(features)} features in {table_name}{filter_desc}"
         
-        await ctx.info(message)
-        
         return {
             "status": "success",
             "project_name": request.project_name,
@@ -488,57 +902,60 @@ async def list_droma_features(
             "total_in_table": total_features,
             "message": message
         }
-        
-    except Exception as e:
-        await ctx.error(f"Error listing features from {request.project_name}_{request.data_sources}: {str(e)}")
-        return {
-            "status": "error",
-            "message": f"Failed to list features from {request.project_name}_{request.data_sources}: {str(e)}"
-        }
 
 
 @database_query_mcp.tool()
-async def list_droma_projects(
+async def list_droma_features(
     ctx: Context,
-    request: ListProjectsModel
+    request: ListFeaturesModel
 ) -> Dict[str, Any]:
     """
-    List all projects available in the DROMA database.
+    List all available features (genes, drugs, etc.) for a specific project and data type.
     
-    Equivalent to R function: listDROMAProjects()
+    Equivalent to R function: listDROMAFeatures()
     """
-    # Get DROMA state
-    droma_state = ctx.request_context.lifespan_context
     
     try:
-        # Get database connection
-        conn = _get_database_connection(droma_state)
-        cursor = conn.cursor()
+        await ctx.info(f"Executing query for features in {request.project_name}_{request.data_sources}")
+        
+        # Run the blocking SQLite work in a worker thread, at most one per pooled connection
+        result = await _run_query(_query_features, request)
         
+        if result["status"] == "success":
+            await ctx.info(result["message"])
+        return result
+    
+    except Exception as e:
+        await ctx.error(f"Error listing features from {request.project_name}_{request.data_sources}: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to list features from {request.project_name}_{request.data_sources}: {str(e)}"
+        }
+
+
+def _query_projects(request: ListProjectsModel) -> Dict[str, Any]:
+    """Run list_droma_projects's queries on a pooled connection."""
+    # Check a database connection out of the pool
+    with _pooled_connection() as conn:
         # Check if projects table exists
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='projects'")
-        has_projects_table = cursor.fetchone() is not None
+        has_projects_table = "projects" in _get_tables(conn)
         
         if has_projects_table:
             # Use the projects table
-            cursor.execute("SELECT * FROM projects")
-            project_rows = cursor.fetchall()
+            project_rows = conn.execute("SELECT * FROM projects").fetchall()
             
             if request.project_data_types:
                 # Return data types for a specific project
                 for row in project_rows:
                     if row[0] == request.project_data_types:  # Assuming project_name is first column
                         # Find data_types column
-                        cursor.execute("PRAGMA table_info(projects)")
-                        columns_info = cursor.fetchall()
-                        column_names = [col[1] for col in columns_info]
+                        column_names = _get_columns(conn, "projects")
                         
                         if "data_types" in column_names:
                             data_types_idx = column_names.index("data_types")
                             data_types_str = row[data_types_idx]
                             data_types = data_types_str.split(",") if data_types_str else []
                             
-                            conn.close()
                             return {
                                 "status": "success",
                                 "project_name": request.project_data_types,
@@ -546,7 +963,6 @@ async def list_droma_projects(
                                 "message": f"Found {len(data_types)} data types for project '{request.project_data_types}'"
                             }
                 
-                conn.close()
                 return {
                     "status": "warning",
                     "message": f"Project '{request.project_data_types}' not found",
@@ -556,7 +972,6 @@ async def list_droma_projects(
             if request.show_names_only:
                 # Return only project names
                 project_names = [row[0] for row in project_rows]  # Assuming project_name is first column
-                conn.close()
                 return {
                     "status": "success",
                     "project_names": project_names,
@@ -564,16 +979,8 @@ async def list_droma_projects(
                 }
             
             # Return full project information
-            cursor.execute("PRAGMA table_info(projects)")
-            columns_info = cursor.fetchall()
-            column_names = [col[1] for col in columns_info]
+            projects_data = [dict(row) for row in project_rows]
             
-            projects_data = []
-            for row in project_rows:
-                project_dict = dict(zip(column_names, row))
-                projects_data.append(project_dict)
-            
-            conn.close()
             return {
                 "status": "success",
                 "projects": projects_data,
@@ -582,22 +989,11 @@ async def list_droma_projects(
             }
         
         else:
-            # Infer projects from table names
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            all_tables = [row[0] for row in cursor.fetchall()]
-            
-            # Extract project names from table prefixes
-            project_names = set()
-            for table in all_tables:
-                if table not in ["sample_anno", "drug_anno", "droma_metadata", "search_vectors"]:
-                    parts = table.split("_")
-                    if len(parts) >= 2:
-                        project_names.add(parts[0])
-            
-            project_names = sorted(list(project_names))
+            # Infer projects from the table names, cached until the file changes
+            inferred_projects = _get_inferred_projects(conn)
+            project_names = list(inferred_projects)
             
             if len(project_names) == 0:
-                conn.close()
                 return {
                     "status": "warning",
                     "message": "No projects found in database",
@@ -607,11 +1003,9 @@ async def list_droma_projects(
             
             if request.project_data_types:
                 # Return data types for a specific project
-                if request.project_data_types in project_names:
-                    project_tables = [t for t in all_tables if t.startswith(f"{request.project_data_types}_")]
-                    data_types = sorted(list(set([t.replace(f"{request.project_data_types}_", "") for t in project_tables])))
+                if request.project_data_types in inferred_projects:
+                    data_types = list(inferred_projects[request.project_data_types])
                     
-                    conn.close()
                     return {
                         "status": "success",
                         "project_name": request.project_data_types,
@@ -619,7 +1013,6 @@ async def list_droma_projects(
                         "message": f"Found {len(data_types)} data types for project '{request.project_data_types}'"
                     }
                 else:
-                    conn.close()
                     return {
                         "status": "warning",
                         "message": f"Project '{request.project_data_types}' not found",
@@ -627,7 +1020,6 @@ async def list_droma_projects(
                     }
             
             if request.show_names_only:
-                conn.close()
                 return {
                     "status": "success",
                     "project_names": project_names,
@@ -642,14 +1034,31 @@ async def list_droma_projects(
                     "source": "inferred_from_tables"
                 })
             
-            conn.close()
             return {
                 "status": "success",
                 "projects": projects_data,
                 "total_projects": len(projects_data),
                 "message": f"Found {len(projects_data)} projects (inferred from table names)"
             }
+
+
+@database_query_mcp.tool()
+async def list_droma_projects(
+    ctx: Context,
+    request: ListProjectsModel
+) -> Dict[str, Any]:
+    """
+    List all projects available in the DROMA database.
+    
+    Equivalent to R function: listDROMAProjects()
+    """
+    
+    try:
+        # Run the blocking SQLite work in a worker thread, at most one per pooled connection
+        result = await _run_query(_query_projects, request)
         
+        return result
+    
     except Exception as e:
         await ctx.error(f"Error listing projects: {str(e)}")
         return {
@@ -2,14 +2,16 @@
 
 import os
 from fastmcp import FastMCP, Context
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 from ..schema.dataset_management import (
+    DatasetType,
     LoadDatasetModel,
     ListDatasetsModel,
     SetActiveDatasetModel,
-    UnloadDatasetModel
+    UnloadDatasetModel,
+    UnloadDatasetsModel
 )
 
 # Create sub-MCP server for dataset management
@@ -29,6 +31,21 @@ def _get_database_path(request_db_path: Optional[str] = None) -> str:
     return db_path
 
 
+async def _remove_r_objects(droma_state, r_object_names: List[str]) -> None:
+    """Remove objects from the R environment with a single rm() call.
+    
+    The names are passed as strings in rm()'s list argument, so names that
+    are not syntactic R names (e.g. starting with a digit) are removed too.
+    """
+    if droma_state.r is None or not r_object_names:
+        return
+    names = ", ".join(f'"{name}"' for name in r_object_names)
+    try:
+        await droma_state.run_r(droma_state.r, f"rm(list = c({names}))")
+    except:
+        pass  # Ignore R cleanup errors
+
+
 @dataset_management_mcp.tool()
 async def load_dataset(
     ctx: Context,
@@ -49,10 +66,11 @@ async def load_dataset(
         # Get database path
         db_path = _get_database_path(request.db_path)
         
-        await ctx.info(f"Loading dataset '{request.dataset_id}' of type '{request.dataset_type}' from {db_path}")
+        await ctx.info(f"Loading dataset '{request.dataset_id}' of type '{request.dataset_type.value}' from {db_path}")
         
-        # Load the dataset using DromaState method
-        success = droma_state.load_dataset(
+        # Load the dataset using DromaState method on the R thread
+        success = await droma_state.run_r(
+            droma_state.load_dataset,
             dataset_id=request.dataset_id,
             db_path=db_path,
             dataset_type=request.dataset_type
@@ -68,7 +86,7 @@ async def load_dataset(
         if request.set_active:
             try:
                 droma_state.set_active_dataset(request.dataset_id, request.dataset_type)
-                active_msg = f" and set as active {request.dataset_type.lower()}"
+                active_msg = f" and set as active {request.dataset_type.value.lower()}"
             except Exception as e:
                 active_msg = f" but failed to set as active: {e}"
         else:
@@ -80,7 +98,7 @@ async def load_dataset(
         return {
             "status": "success",
             "dataset_id": request.dataset_id,
-            "dataset_type": request.dataset_type,
+            "dataset_type": request.dataset_type.value,
             "message": f"Successfully loaded dataset '{request.dataset_id}'{active_msg}",
             "loaded_datasets": datasets_info,
             "active_dataset": droma_state.active_dataset,
@@ -121,24 +139,31 @@ async def list_loaded_datasets(
         }
         
         if request.include_details:
-            # Add detailed information about each dataset
-            result["dataset_details"] = {}
+            # Add detailed information about each dataset, read straight from
+            # the registries instead of looking each listed ID up again
+            active_dataset = droma_state.active_dataset
+            active_multidataset = droma_state.active_multidataset
             
             # For regular datasets
-            for dataset_id in datasets_info["datasets"]:
-                result["dataset_details"][dataset_id] = {
+            dataset_details = {
+                dataset_id: {
                     "type": "DromaSet",
-                    "r_object_name": droma_state.datasets[dataset_id],
-                    "is_active": dataset_id == droma_state.active_dataset
+                    "r_object_name": r_object_name,
+                    "is_active": dataset_id == active_dataset
                 }
+                for dataset_id, r_object_name in droma_state.datasets.items()
+            }
             
             # For multidatasets
-            for dataset_id in datasets_info["multidatasets"]:
-                result["dataset_details"][dataset_id] = {
-                    "type": "MultiDromaSet", 
-                    "r_object_name": droma_state.multidatasets[dataset_id],
-                    "is_active": dataset_id == droma_state.active_multidataset
-                }
+            dataset_details.update(
+                (dataset_id, {
+                    "type": "MultiDromaSet",
+                    "r_object_name": r_object_name,
+                    "is_active": dataset_id == active_multidataset
+                })
+                for dataset_id, r_object_name in droma_state.multidatasets.items()
+            )
+            result["dataset_details"] = dataset_details
         
         message = f"Found {result['total_loaded']} loaded datasets"
         if result['total_loaded'] > 0:
@@ -174,13 +199,13 @@ async def set_active_dataset(
         # Set the active dataset
         droma_state.set_active_dataset(request.dataset_id, request.dataset_type)
         
-        await ctx.info(f"Set '{request.dataset_id}' as active {request.dataset_type.lower()}")
+        await ctx.info(f"Set '{request.dataset_id}' as active {request.dataset_type.value.lower()}")
         
         return {
             "status": "success",
             "dataset_id": request.dataset_id,
-            "dataset_type": request.dataset_type,
-            "message": f"Successfully set '{request.dataset_id}' as active {request.dataset_type.lower()}",
+            "dataset_type": request.dataset_type.value,
+            "message": f"Successfully set '{request.dataset_id}' as active {request.dataset_type.value.lower()}",
             "active_dataset": droma_state.active_dataset,
             "active_multidataset": droma_state.active_multidataset
         }
@@ -208,51 +233,22 @@ async def unload_dataset(
     
     try:
         # Check if dataset exists
-        datasets_info = droma_state.list_datasets()
-        
-        if request.dataset_type == "DromaSet":
-            if request.dataset_id not in datasets_info["datasets"]:
-                return {
-                    "status": "warning",
-                    "message": f"Dataset '{request.dataset_id}' is not loaded"
-                }
-            
-            # Remove from R environment if possible
-            if droma_state.r is not None:
-                r_object_name = droma_state.datasets[request.dataset_id]
-                try:
-                    droma_state.r(f"rm({r_object_name})")
-                except:
-                    pass  # Ignore R cleanup errors
-            
-            # Remove from state
-            del droma_state.datasets[request.dataset_id]
-            
-            # Clear active dataset if this was it
-            if droma_state.active_dataset == request.dataset_id:
-                droma_state.active_dataset = None
-                
+        if request.dataset_type is DatasetType.DROMA_SET:
+            loaded, label = droma_state.datasets, "Dataset"
         else:  # MultiDromaSet
-            if request.dataset_id not in datasets_info["multidatasets"]:
-                return {
-                    "status": "warning",
-                    "message": f"MultiDataset '{request.dataset_id}' is not loaded"
-                }
-            
-            # Remove from R environment if possible
-            if droma_state.r is not None:
-                r_object_name = droma_state.multidatasets[request.dataset_id]
-                try:
-                    droma_state.r(f"rm({r_object_name})")
-                except:
-                    pass  # Ignore R cleanup errors
-            
-            # Remove from state
-            del droma_state.multidatasets[request.dataset_id]
-            
-            # Clear active multidataset if this was it
-            if droma_state.active_multidataset == request.dataset_id:
-                droma_state.active_multidataset = None
+            loaded, label = droma_state.multidatasets, "MultiDataset"
+        
+        if request.dataset_id not in loaded:
+            return {
+                "status": "warning",
+                "message": f"{label} '{request.dataset_id}' is not loaded"
+            }
+        
+        # Remove from state, clearing it as the active dataset if it was
+        r_object_name = droma_state.remove_dataset(request.dataset_id, request.dataset_type)
+        
+        # Remove from R environment if possible
+        await _remove_r_objects(droma_state, [r_object_name])
         
         await ctx.info(f"Unloaded dataset '{request.dataset_id}'")
         
@@ -262,7 +258,7 @@ async def unload_dataset(
         return {
             "status": "success",
             "dataset_id": request.dataset_id,
-            "dataset_type": request.dataset_type,
+            "dataset_type": request.dataset_type.value,
             "message": f"Successfully unloaded dataset '{request.dataset_id}'",
             "remaining_datasets": updated_info,
             "active_dataset": droma_state.active_dataset,
@@ -274,4 +270,65 @@ async def unload_dataset(
         return {
             "status": "error",
             "message": f"Failed to unload dataset '{request.dataset_id}': {str(e)}"
-        } 
\ No newline at end of file
+        }
+
+
+@dataset_management_mcp.tool()
+async def unload_datasets(
+    ctx: Context,
+    request: UnloadDatasetsModel
+) -> Dict[str, Any]:
+    """
+    Unload several datasets from memory at once.
+    
+    Their R objects are removed with a single rm() call instead of one per dataset.
+    """
+    # Get DROMA state
+    droma_state = ctx.request_context.lifespan_context
+    
+    try:
+        # Remove from state, collecting the R objects to clean up
+        unloaded = []
+        not_loaded = []
+        r_object_names = []
+        for dataset_id in request.dataset_ids:
+            r_object_name = droma_state.remove_dataset(dataset_id, request.dataset_type)
+            if r_object_name is None:
+                not_loaded.append(dataset_id)
+            else:
+                unloaded.append(dataset_id)
+                r_object_names.append(r_object_name)
+        
+        if not unloaded:
+            return {
+                "status": "warning",
+                "message": f"None of the requested datasets are loaded: {', '.join(not_loaded)}",
+                "not_loaded": not_loaded
+            }
+        
+        # Remove from R environment if possible
+        await _remove_r_objects(droma_state, r_object_names)
+        
+        message = f"Successfully unloaded {len(unloaded)} datasets: {', '.join(unloaded)}"
+        if not_loaded:
+            message += f" ({len(not_loaded)} not loaded: {', '.join(not_loaded)})"
+        
+        await ctx.info(message)
+        
+        return {
+            "status": "success",
+            "unloaded": unloaded,
+            "not_loaded": not_loaded,
+            "dataset_type": request.dataset_type.value,
+            "message": message,
+            "remaining_datasets": droma_state.list_datasets(),
+            "active_dataset": droma_state.active_dataset,
+            "active_multidataset": droma_state.active_multidataset
+        }
+        
+    except Exception as e:
+        await ctx.error(f"Error unloading datasets: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to unload datasets {', '.join(request.dataset_ids)}: {str(e)}"
+        }
@@ -1,24 +1,160 @@
 """Utility functions for DROMA MCP server."""
 
+import os
+import re
+import time
+import functools
+import hashlib
 import tempfile
 import json
 import logging
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from typing import TYPE_CHECKING, Dict, Any, NamedTuple, Optional, Union
 from starlette.requests import Request
 from starlette.responses import FileResponse, JSONResponse
-import pandas as pd
+
+if TYPE_CHECKING:
+    # pandas is only needed for annotations here; importing it is slow, so
+    # server startup leaves it to the modules that work with data
+    import pandas as pd
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
-# Global storage for exports and figures
-EXPORTS: Dict[str, str] = {}
-FIGURES: Dict[str, str] = {}
+
+class RegisteredFile(NamedTuple):
+    """A file registered for download."""
+    path: str
+    created: float  # time.time() at registration
+
+
+# Global storage for exports and figures, oldest registration first
+EXPORTS: "OrderedDict[str, RegisteredFile]" = OrderedDict()
+FIGURES: "OrderedDict[str, RegisteredFile]" = OrderedDict()
+
+# Whether setup_server() has already run in this process
+_setup_complete = False
+
+# Directories for saved exports and figures
+_EXPORT_DIR = Path(tempfile.gettempdir()) / "droma_mcp_exports"
+_FIGURE_DIR = Path(tempfile.gettempdir()) / "droma_mcp_figures"
+
+# Media types for export downloads, by file extension
+_EXPORT_MEDIA_TYPES = {
+    '.csv': 'text/csv',
+    '.json': 'application/json',
+    '.excel': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    '.parquet': 'application/vnd.apache.parquet',
+    '.feather': 'application/vnd.apache.arrow.file',
+}
+
+# Units for format_data_size, each 1024 times the previous one
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Characters allowed in cache keys
+_CACHE_KEY_RE = re.compile(r'[A-Za-z0-9_]+')
+
+# Characters dropped from key parts by generate_cache_key (\w is str.isalnum() plus '_')
+_KEY_PART_UNSAFE_RE = re.compile(r'[^\w-]')
+
+
+def _ensure_dir(directory: Path) -> Path:
+    """Create directory if needed and return it.
+    
+    Checked on every save, so a long-running server recovers when a tmp
+    cleaner removes the directory.
+    """
+    directory.mkdir(exist_ok=True)
+    return directory
+
+
+def _register_file(registry: "OrderedDict[str, RegisteredFile]", file_id: str, filepath: Path) -> None:
+    """Register a file for download, keeping the registry in registration order."""
+    registry.pop(file_id, None)
+    registry[file_id] = RegisteredFile(str(filepath), time.time())
+
+
+def _expire_files(registry: "OrderedDict[str, RegisteredFile]", cutoff: float) -> int:
+    """Delete files registered before cutoff, oldest first, and return how many were removed."""
+    removed = 0
+    while registry:
+        file_id, entry = next(iter(registry.items()))
+        if entry.created >= cutoff:
+            break
+        Path(entry.path).unlink(missing_ok=True)
+        del registry[file_id]
+        removed += 1
+    return removed
+
+
+def _sweep_unregistered(directory: Path, registry: "OrderedDict[str, RegisteredFile]", cutoff: float) -> int:
+    """Delete unregistered files last modified before cutoff from directory, returning how many."""
+    registered = {entry.path for entry in registry.values()}
+    removed = 0
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.path in registered or not entry.is_file():
+                    continue
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    removed += 1
+    except FileNotFoundError:
+        pass  # Nothing has been saved yet
+    return removed
+
+
+def _content_digest(result_df: "pd.DataFrame", format: str) -> Optional[str]:
+    """Hash a DataFrame's columns, dtypes and values with the export format.
+    
+    Returns None if the values cannot be hashed (e.g. cells holding lists).
+    """
+    from pandas.util import hash_pandas_object
+    
+    try:
+        # Vectorized per-row hashes, then one BLAKE2 pass over them
+        row_hashes = hash_pandas_object(result_df, index=False).to_numpy()
+    except TypeError:
+        return None
+    digest = hashlib.blake2b(format.encode(), digest_size=8)
+    digest.update(repr([(str(column), str(dtype)) for column, dtype in result_df.dtypes.items()]).encode())
+    digest.update(row_hashes.tobytes())
+    return digest.hexdigest()
+
+
+@functools.cache
+def _arrow_csv():
+    """Return (pyarrow, pyarrow.csv) if pyarrow is installed, else None."""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return None
+    return pa, pa_csv
+
+
+def _write_csv_with_arrow(result_df: "pd.DataFrame", filepath: Path) -> bool:
+    """Write a CSV with Arrow's multithreaded C++ writer, much faster than pandas.
+    
+    Returns False, leaving the file to the pandas writer, if pyarrow is not
+    installed or cannot convert the frame (e.g. object columns mixing types).
+    """
+    arrow = _arrow_csv()
+    if arrow is None:
+        return False
+    pa, pa_csv = arrow
+    try:
+        table = pa.Table.from_pandas(result_df, preserve_index=False)
+        pa_csv.write_csv(table, filepath)
+    except (pa.ArrowException, TypeError, ValueError) as e:
+        logger.debug(f"Arrow CSV writer unavailable for this frame, using pandas: {e}")
+        return False
+    return True
 
 
 def save_analysis_result(
-    result_df: pd.DataFrame, 
+    result_df: "pd.DataFrame", 
     name: Optional[str] = None,
     format: str = "csv"
 ) -> str:
@@ -27,8 +163,9 @@ def save_analysis_result(
     
     Args:
         result_df: DataFrame to save
-        name: Optional filename (auto-generated if None)
-        format: File format ('csv', 'excel', 'json')
+        name: Optional filename (derived from the content if None, so saving
+            the same result again reuses the existing export)
+        format: File format ('csv', 'excel', 'json', 'parquet', 'feather')
     
     Returns:
         Export identifier for retrieval
@@ -37,34 +174,50 @@ def save_analysis_result(
         ValueError: If format is not supported
         IOError: If file cannot be written
     """
-    if format not in ['csv', 'excel', 'json']:
-        raise ValueError(f"Unsupported format: {format}. Use 'csv', 'excel', or 'json'")
+    if format not in ['csv', 'excel', 'json', 'parquet', 'feather']:
+        raise ValueError(
+            f"Unsupported format: {format}. Use 'csv', 'excel', 'json', 'parquet' or 'feather'"
+        )
     
     if name is None:
-        name = f"droma_analysis_{len(EXPORTS)}.{format}"
+        digest = _content_digest(result_df, format)
+        if digest is None:
+            name = f"droma_analysis_{len(EXPORTS)}.{format}"
+        else:
+            # Identical results get the same ID; skip writing them again
+            export_id = f"droma_analysis_{digest}"
+            existing = EXPORTS.get(export_id)
+            if existing is not None and os.path.exists(existing.path):
+                _register_file(EXPORTS, export_id, existing.path)
+                logger.info(f"Reused saved analysis result: {export_id} ({format})")
+                return export_id
+            name = f"{export_id}.{format}"
     
     # Ensure name has correct extension
     if not name.endswith(f'.{format}'):
         name = f"{name}.{format}"
     
-    # Create temp directory
-    temp_dir = Path(tempfile.gettempdir()) / "droma_mcp_exports"
-    temp_dir.mkdir(exist_ok=True)
-    
     # Save file
-    filepath = temp_dir / name
+    filepath = _ensure_dir(_EXPORT_DIR) / name
     
     try:
         if format == "csv":
-            result_df.to_csv(filepath, index=False)
+            if not _write_csv_with_arrow(result_df, filepath):
+                # Write in row chunks to bound the size of the formatted text buffer
+                result_df.to_csv(filepath, index=False, chunksize=100_000)
         elif format == "excel":
             result_df.to_excel(filepath, index=False, engine='openpyxl')
         elif format == "json":
             result_df.to_json(filepath, orient='records', indent=2)
+        elif format == "parquet":
+            # Binary columnar formats skip per-cell text formatting (need pyarrow)
+            result_df.to_parquet(filepath, index=False, compression='zstd')
+        elif format == "feather":
+            result_df.reset_index(drop=True).to_feather(filepath, compression='lz4')
         
         # Store in global registry
-        export_id = name.replace(f'.{format}', '')
-        EXPORTS[export_id] = str(filepath)
+        export_id = filepath.stem
+        _register_file(EXPORTS, export_id, filepath)
         
         logger.info(f"Saved analysis result: {export_id} ({format})")
         return export_id
@@ -107,19 +260,16 @@ def save_figure(fig_path: Union[str, Path], name: Optional[str] = None) -> str:
     if not name.endswith(fig_path.suffix):
         name = f"{name}{fig_path.suffix}"
     
-    # Create temp directory and copy file
-    temp_dir = Path(tempfile.gettempdir()) / "droma_mcp_figures"
-    temp_dir.mkdir(exist_ok=True)
-    
-    dest_path = temp_dir / name
+    # Copy file into the figures directory
+    dest_path = _ensure_dir(_FIGURE_DIR) / name
     
     try:
         import shutil
         shutil.copy2(fig_path, dest_path)
         
         # Store in global registry
-        fig_id = name.replace(fig_path.suffix, '')
-        FIGURES[fig_id] = str(dest_path)
+        fig_id = dest_path.stem
+        _register_file(FIGURES, fig_id, dest_path)
         
         logger.info(f"Saved figure: {fig_id}")
         return fig_id
@@ -155,20 +305,25 @@ async def get_data_export(request: Request) -> Union[FileResponse, JSONResponse]
                 status_code=404
             )
         
-        filepath = EXPORTS[data_id]
+        filepath = EXPORTS[data_id].path
         
-        # Verify file still exists
-        if not Path(filepath).exists():
+        # Verify file still exists; the same stat() result serves the response
+        # headers, so FileResponse does not stat the file again
+        try:
+            stat_result = os.stat(filepath)
+        except FileNotFoundError:
             return JSONResponse(
                 {"error": f"Export file not found on disk: {filepath}"}, 
                 status_code=404
             )
         
         # Return file
-        filename = Path(filepath).name
+        filename = os.path.basename(filepath)
         return FileResponse(
             filepath,
+            media_type=_EXPORT_MEDIA_TYPES.get(os.path.splitext(filename)[1], 'application/octet-stream'),
             filename=filename,
+            stat_result=stat_result,
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
         
@@ -206,17 +361,20 @@ async def get_figure(request: Request) -> Union[FileResponse, JSONResponse]:
                 status_code=404
             )
         
-        filepath = FIGURES[figure_name]
+        filepath = FIGURES[figure_name].path
         
-        # Verify file still exists
-        if not Path(filepath).exists():
+        # Verify file still exists; the same stat() result serves the response
+        # headers, so FileResponse does not stat the file again
+        try:
+            stat_result = os.stat(filepath)
+        except FileNotFoundError:
             return JSONResponse(
                 {"error": f"Figure file not found on disk: {filepath}"}, 
                 status_code=404
             )
         
         # Return file with appropriate content type
-        return FileResponse(filepath)
+        return FileResponse(filepath, stat_result=stat_result)
         
     except Exception as e:
         logger.error(f"Figure download error: {e}")
@@ -226,6 +384,24 @@ async def get_figure(request: Request) -> Union[FileResponse, JSONResponse]:
         )
 
 
+def _describe_files(registry: "OrderedDict[str, RegisteredFile]") -> Dict[str, Dict[str, Any]]:
+    """Describe the registered files still on disk, with one stat() call per file."""
+    files_info = {}
+    for file_id, entry in registry.items():
+        try:
+            st = os.stat(entry.path)
+        except FileNotFoundError:
+            continue
+        filename = os.path.basename(entry.path)
+        files_info[file_id] = {
+            "filename": filename,
+            "size_bytes": st.st_size,
+            "created": st.st_mtime,
+            "format": os.path.splitext(filename)[1][1:]  # Remove dot
+        }
+    return files_info
+
+
 def list_available_files() -> Dict[str, Any]:
     """
     List all available files for download.
@@ -234,27 +410,8 @@ def list_available_files() -> Dict[str, Any]:
         Dictionary with exports and figures information
     """
     try:
-        exports_info = {}
-        for export_id, filepath in EXPORTS.items():
-            path = Path(filepath)
-            if path.exists():
-                exports_info[export_id] = {
-                    "filename": path.name,
-                    "size_bytes": path.stat().st_size,
-                    "created": path.stat().st_mtime,
-                    "format": path.suffix[1:]  # Remove dot
-                }
-        
-        figures_info = {}
-        for fig_id, filepath in FIGURES.items():
-            path = Path(filepath)
-            if path.exists():
-                figures_info[fig_id] = {
-                    "filename": path.name,
-                    "size_bytes": path.stat().st_size,
-                    "created": path.stat().st_mtime,
-                    "format": path.suffix[1:]  # Remove dot
-                }
+        exports_info = _describe_files(EXPORTS)
+        figures_info = _describe_files(FIGURES)
         
         return {
             "exports": exports_info,
@@ -278,42 +435,18 @@ def cleanup_temp_files(max_age_hours: int = 24) -> Dict[str, int]:
     Returns:
         Summary of cleanup operation
     """
-    import time
-    
-    current_time = time.time()
-    max_age_seconds = max_age_hours * 3600
-    
-    cleaned_exports = 0
-    cleaned_figures = 0
+    cutoff = time.time() - max_age_hours * 3600
     
     try:
-        # Clean exports
-        for export_id in list(EXPORTS.keys()):
-            filepath = Path(EXPORTS[export_id])
-            if filepath.exists():
-                file_age = current_time - filepath.stat().st_mtime
-                if file_age > max_age_seconds:
-                    filepath.unlink()
-                    del EXPORTS[export_id]
-                    cleaned_exports += 1
-            else:
-                # File doesn't exist, remove from registry
-                del EXPORTS[export_id]
-                cleaned_exports += 1
-        
-        # Clean figures
-        for fig_id in list(FIGURES.keys()):
-            filepath = Path(FIGURES[fig_id])
-            if filepath.exists():
-                file_age = current_time - filepath.stat().st_mtime
-                if file_age > max_age_seconds:
-                    filepath.unlink()
-                    del FIGURES[fig_id]
-                    cleaned_figures += 1
-            else:
-                # File doesn't exist, remove from registry
-                del FIGURES[fig_id]
-                cleaned_figures += 1
+        # The registries are in registration order, so only the expired
+        # entries at the front are visited
+        cleaned_exports = _expire_files(EXPORTS, cutoff)
+        cleaned_figures = _expire_files(FIGURES, cutoff)
+        
+        # Also remove old files no registry knows about, e.g. left behind by
+        # an earlier server process
+        cleaned_exports += _sweep_unregistered(_EXPORT_DIR, EXPORTS, cutoff)
+        cleaned_figures += _sweep_unregistered(_FIGURE_DIR, FIGURES, cutoff)
         
         logger.info(f"Cleanup completed: {cleaned_exports} exports, {cleaned_figures} figures removed")
         
@@ -331,25 +464,22 @@ def cleanup_temp_files(max_age_hours: int = 24) -> Dict[str, int]:
 
 def format_data_size(size_bytes: int) -> str:
     """Format data size in human-readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    # Each unit is 10 more bits, so the bit length picks the unit directly
+    index = min(len(_SIZE_UNITS) - 1, max(0, (int(size_bytes).bit_length() - 1) // 10))
+    return f"{size_bytes / (1 << (index * 10)):.1f} {_SIZE_UNITS[index]}"
 
 
 def validate_cache_key(cache_key: str) -> bool:
     """Validate cache key format."""
     # Basic validation - alphanumeric and underscores only
-    import re
-    return bool(re.match(r'^[a-zA-Z0-9_]+$', cache_key))
+    return _CACHE_KEY_RE.fullmatch(cache_key) is not None
 
 
 def generate_cache_key(prefix: str, dataset_id: str, data_type: str) -> str:
     """Generate a standardized cache key."""
     # Remove any problematic characters and create a clean key
-    clean_dataset = "".join(c for c in dataset_id if c.isalnum() or c in ['_', '-'])
-    clean_type = "".join(c for c in data_type if c.isalnum() or c in ['_', '-'])
+    clean_dataset = _KEY_PART_UNSAFE_RE.sub('', dataset_id)
+    clean_type = _KEY_PART_UNSAFE_RE.sub('', data_type)
     
     return f"{prefix}_{clean_dataset}_{clean_type}"
 
@@ -358,16 +488,24 @@ class DataValidator:
     """Utility class for data validation."""
     
     @staticmethod
-    def validate_dataframe(df: pd.DataFrame, min_rows: int = 1, min_cols: int = 1) -> Dict[str, Any]:
-        """Validate pandas DataFrame."""
+    def validate_dataframe(
+        df: "pd.DataFrame", min_rows: int = 1, min_cols: int = 1, deep_memory: bool = False
+    ) -> Dict[str, Any]:
+        """Validate pandas DataFrame.
+        
+        deep_memory also counts the Python objects held by object columns,
+        which means visiting every cell of those columns.
+        """
+        # Build the null mask once for the counts and the all-null check
+        null_mask = df.isnull()
         validation_result = {
             "valid": True,
             "issues": [],
             "info": {
                 "shape": df.shape,
                 "dtypes": df.dtypes.to_dict(),
-                "memory_usage": df.memory_usage(deep=True).sum(),
-                "null_counts": df.isnull().sum().to_dict()
+                "memory_usage": df.memory_usage(deep=deep_memory).sum(),
+                "null_counts": null_mask.sum().to_dict()
             }
         }
         
@@ -381,7 +519,7 @@ class DataValidator:
             validation_result["issues"].append(f"Too few columns: {df.shape[1]} < {min_cols}")
         
         # Check for all-null columns
-        all_null_cols = df.columns[df.isnull().all()].tolist()
+        all_null_cols = df.columns[null_mask.all()].tolist()
         if all_null_cols:
             validation_result["issues"].append(f"All-null columns: {all_null_cols}")
         
@@ -393,10 +531,14 @@ class DataValidator:
         return validation_result
     
     @staticmethod
-    def check_normalization_quality(df: pd.DataFrame) -> Dict[str, Any]:
+    def check_normalization_quality(df: "pd.DataFrame") -> Dict[str, Any]:
         """Check quality of z-score normalization."""
-        values = df.values.flatten()
-        values = values[~pd.isna(values)]  # Remove NaN values
+        import pandas as pd
+        
+        # Boolean indexing of the 2-D array yields the present values as one
+        # compact 1-D copy, so the matrix is not flattened first
+        values = df.to_numpy()
+        values = values[~pd.isna(values)]
         
         if len(values) == 0:
             return {"valid": False, "reason": "No valid values found"}
@@ -420,12 +562,17 @@ class DataValidator:
 # Async setup function for server initialization
 async def setup_server() -> None:
     """Setup function called during server initialization."""
+    global _setup_complete
+    if _setup_complete:
+        return
+    _setup_complete = True
+    
     # Create temp directories
-    temp_base = Path(tempfile.gettempdir()) / "droma_mcp"
-    (temp_base / "exports").mkdir(parents=True, exist_ok=True)
-    (temp_base / "figures").mkdir(parents=True, exist_ok=True)
+    _ensure_dir(_EXPORT_DIR)
+    _ensure_dir(_FIGURE_DIR)
     
     # Clean up old files
     cleanup_temp_files(max_age_hours=24)
     
-    print("DROMA MCP utility services initialized") 
\ No newline at end of file
+    # stdout carries the STDIO transport's JSON-RPC stream, so log instead of printing
+    logger.info("DROMA MCP utility services initialized")
\ No newline at end of file
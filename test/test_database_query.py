@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""Tests for DROMA MCP database query helpers against a temporary SQLite database."""
+
+import asyncio
+import base64
+import os
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add the src directory to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent / ".."))
+
+from src.droma_mcp.server.database_query import (
+    _nocase_prefix_bounds,
+    _query_annotation,
+    _query_annotation_chunk,
+    _query_features,
+    _query_projects,
+    _query_samples,
+    _regex_to_like,
+    list_droma_samples
+)
+from src.droma_mcp.schema.database_query import (
+    GetAnnotationModel,
+    ListFeaturesModel,
+    ListProjectsModel,
+    ListSamplesModel
+)
+
+
+SAMPLE_IDS = ["ACH-001", "ach-002", "Ach-003", "ACX-004", "AC@1", "ACa", "ac_x", "acbx", "ÉCH-005", "éch-006", "äch-007"]
+FEATURES = ["TP53", "tp63", "Tp73", "EGFR", "TP_1", "TPX"]
+
+
+# Call the tool's function directly rather than through the MCP server
+list_droma_samples = getattr(list_droma_samples, "fn", list_droma_samples)
+
+
+class MockContext:
+    """Mock context for testing."""
+    
+    def __init__(self):
+        self.request_context = Mock()
+    
+    async def info(self, message):
+        print(f"INFO: {message}")
+    
+    async def error(self, message):
+        print(f"ERROR: {message}")
+
+
+class _DatabasePath:
+    """Point DROMA_DB_PATH at a database for the duration of a with block."""
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.previous_path = None
+    
+    def __enter__(self):
+        self.previous_path = os.environ.get('DROMA_DB_PATH')
+        os.environ['DROMA_DB_PATH'] = self.db_path
+        return self.db_path
+    
+    def __exit__(self, *exc_info):
+        if self.previous_path is None:
+            os.environ.pop('DROMA_DB_PATH', None)
+        else:
+            os.environ['DROMA_DB_PATH'] = self.previous_path
+
+
+def _create_test_database() -> str:
+    """Create a small DROMA-like database with mixed-case sample and feature IDs."""
+    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp_db:
+        db_path = tmp_db.name
+    
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE sample_anno (SampleID TEXT, ProjectID TEXT, DataType TEXT, TumorType TEXT)")
+    conn.executemany(
+        "INSERT INTO sample_anno VALUES (?, 'TEST', 'CellLine', 'lung')",
+        [(sample_id,) for sample_id in SAMPLE_IDS]
+    )
+    conn.execute("CREATE INDEX sample_anno_id ON sample_anno (SampleID)")
+    conn.execute("CREATE TABLE TEST_mRNA (feature_id TEXT, \"ACH-001\" REAL)")
+    conn.executemany("INSERT INTO TEST_mRNA VALUES (?, 1.0)", [(feature,) for feature in FEATURES])
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+def _like_matches(db_path: str, query: str, pattern: str) -> list:
+    """Get the IDs a plain LIKE query matches for a regex pattern."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return [row[0] for row in conn.execute(query, [_regex_to_like(pattern)])]
+    finally:
+        conn.close()
+
+
+def test_prefix_pattern_matches_like():
+    """Test that anchored prefix patterns return exactly what LIKE returns."""
+    print("=== Testing prefix patterns against LIKE ===")
+    print()
+    
+    db_path = _create_test_database()
+    try:
+        with _DatabasePath(db_path):
+            for pattern in ["^ACH", "^ach", "^Ach-00", "^ac", "^AC@", "^ÉCH", "^éch", "^ac_", "^ACH.*"]:
+                result = _query_samples(ListSamplesModel(project_name="TEST", pattern=pattern))
+                expected = _like_matches(
+                    db_path,
+                    "SELECT DISTINCT SampleID FROM sample_anno WHERE SampleID LIKE ? ORDER BY SampleID",
+                    pattern
+                )
+                print(f"Samples {pattern!r}: {result['samples']}")
+                assert result["status"] == "success"
+                assert result["samples"] == expected, (pattern, result["samples"], expected)
+            
+            for pattern in ["^TP", "^tp", "^Tp7", "^TP_"]:
+                result = _query_features(ListFeaturesModel(project_name="TEST", data_sources="mRNA", pattern=pattern))
+                expected = _like_matches(
+                    db_path,
+                    "SELECT DISTINCT feature_id FROM TEST_mRNA WHERE feature_id LIKE ? ORDER BY feature_id",
+                    pattern
+                )
+                print(f"Features {pattern!r}: {result['features']}")
+                assert result["status"] == "success"
+                assert result["features"] == expected, (pattern, result["features"], expected)
+            print("✓ Prefix patterns match LIKE\n")
+    
+    finally:
+        os.unlink(db_path)
+
+
+def test_fts_pattern_matches_like():
+    """Test that substring patterns return the same samples with and without an FTS5 index."""
+    print("=== Testing substring patterns with and without FTS5 ===")
+    print()
+    
+    patterns = ["ch-", "CH-00", "c_x", "ach%", "ÄCH", "éch", "ÉCH-0"]
+    db_path = _create_test_database()
+    try:
+        with _DatabasePath(db_path):
+            without_fts = {
+                pattern: _query_samples(ListSamplesModel(project_name="TEST", pattern=pattern))["samples"]
+                for pattern in patterns
+            }
+            
+            # The index from _indexed_pattern_condition's docstring
+            conn = sqlite3.connect(db_path)
+            conn.execute(
+                "CREATE VIRTUAL TABLE sample_anno_fts USING fts5("
+                "SampleID, content='sample_anno', tokenize='trigram')"
+            )
+            conn.execute("INSERT INTO sample_anno_fts(sample_anno_fts) VALUES ('rebuild')")
+            conn.commit()
+            conn.close()
+            stat = os.stat(db_path)
+            os.utime(db_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            
+            for pattern in patterns:
+                result = _query_samples(ListSamplesModel(project_name="TEST", pattern=pattern))
+                print(f"Samples {pattern!r}: {result['samples']}")
+                assert result["status"] == "success"
+                assert result["samples"] == without_fts[pattern], (pattern, result["samples"], without_fts[pattern])
+        print("✓ FTS5 index does not change the matches\n")
+    
+    finally:
+        os.unlink(db_path)
+
+
+def test_annotation_chunks():
+    """Test paging through annotations with next_offset, with and without a limit."""
+    print("=== Testing chunked annotation paging ===")
+    print()
+    
+    def pages(request, chunk_size):
+        """Collect (offset, row IDs, next_offset) for each page until next_offset is None."""
+        collected = []
+        offset = 0
+        while offset is not None:
+            result = _query_annotation_chunk(request, offset, chunk_size)
+            assert result["status"] == "success"
+            collected.append((result["offset"], [row["SampleID"] for row in result["data"]], result["next_offset"]))
+            offset = result["next_offset"]
+        return collected
+    
+    db_path = _create_test_database()
+    try:
+        with _DatabasePath(db_path):
+            all_ids = [row["SampleID"] for row in _query_annotation(GetAnnotationModel(anno_type="sample"))["data"]]
+            assert len(all_ids) == len(SAMPLE_IDS)
+            
+            # next_offset advances one page at a time; the short last page ends it
+            result = pages(GetAnnotationModel(anno_type="sample"), 4)
+            print(f"Pages of 4: {result}")
+            assert [(offset, next_offset) for offset, _, next_offset in result] == [(0, 4), (4, 8), (8, None)]
+            assert [sample for _, ids, _ in result for sample in ids] == all_ids
+            
+            # A full last page needs one more, empty, request to end
+            result = pages(GetAnnotationModel(anno_type="sample"), len(SAMPLE_IDS))
+            print(f"Pages of {len(SAMPLE_IDS)}: {result}")
+            assert result == [(0, all_ids, len(SAMPLE_IDS)), (len(SAMPLE_IDS), [], None)]
+            
+            # limit caps the rows across pages, ending on the page that reaches it
+            result = pages(GetAnnotationModel(anno_type="sample", limit=6), 4)
+            print(f"Pages of 4 with limit 6: {result}")
+            assert [(offset, next_offset) for offset, _, next_offset in result] == [(0, 4), (4, None)]
+            assert [sample for _, ids, _ in result for sample in ids] == all_ids[:6]
+            
+            result = pages(GetAnnotationModel(anno_type="sample", limit=8), 4)
+            assert [(offset, len(ids), next_offset) for offset, ids, next_offset in result] == [(0, 4, 4), (4, 4, None)]
+        print("✓ Pages follow next_offset and respect the limit\n")
+    
+    finally:
+        os.unlink(db_path)
+
+
+def test_annotation_output_formats():
+    """Test that records and columnar output leave out the internal _total column."""
+    print("=== Testing annotation output formats ===")
+    print()
+    
+    db_path = _create_test_database()
+    try:
+        with _DatabasePath(db_path):
+            columns = ["SampleID", "ProjectID", "DataType", "TumorType"]
+            
+            # An unfiltered request with include_total counts with a _total window column
+            result = _query_annotation(GetAnnotationModel(anno_type="sample", limit=3, include_total=True))
+            assert result["total_in_database"] == len(SAMPLE_IDS)
+            assert [list(record) for record in result["data"]] == [columns] * 3
+            
+            # Clear the row count cache so the columnar request counts in its query too
+            conn = sqlite3.connect(db_path)
+            conn.execute("INSERT INTO sample_anno VALUES ('ZZZ-001', 'TEST', 'CellLine', 'lung')")
+            conn.commit()
+            conn.close()
+            stat = os.stat(db_path)
+            os.utime(db_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            
+            result = _query_annotation(GetAnnotationModel(
+                anno_type="sample", limit=3, include_total=True, output_format="columnar"
+            ))
+            print(f"Columnar: {result['data']}")
+            assert result["total_in_database"] == len(SAMPLE_IDS) + 1
+            assert result["data"]["columns"] == columns
+            assert all(len(row) == len(columns) for row in result["data"]["rows"])
+            assert len(result["data"]["rows"]) == 3
+            
+            result = _query_annotation_chunk(GetAnnotationModel(anno_type="sample", output_format="columnar"), 0, 2)
+            assert result["data"]["columns"] == columns
+            assert result["data"]["rows"] == [[sample_id, "TEST", "CellLine", "lung"] for sample_id in ["AC@1", "ACH-001"]]
+            
+            for output_format in ("arrow", "parquet"):
+                request = GetAnnotationModel(anno_type="sample", limit=3, include_total=True, output_format=output_format)
+                try:
+                    import pyarrow
+                except ImportError:
+                    # Without pyarrow the encoded formats fail with an install hint
+                    try:
+                        _query_annotation(request)
+                    except RuntimeError as e:
+                        assert "pyarrow" in str(e)
+                    else:
+                        raise AssertionError(f"'{output_format}' output needs pyarrow")
+                    continue
+                
+                import pyarrow.parquet
+                encoded = base64.b64decode(_query_annotation(request)["data"])
+                if output_format == "arrow":
+                    table = pyarrow.ipc.open_stream(encoded).read_all()
+                else:
+                    table = pyarrow.parquet.read_table(pyarrow.BufferReader(encoded))
+                print(f"{output_format}: {table.to_pydict()}")
+                assert table.column_names == columns
+                assert table.num_rows == 3
+        print("✓ Output formats hold only the table's columns\n")
+    
+    finally:
+        os.unlink(db_path)
+
+
+def test_prefix_bounds_fallback():
+    """Test that prefixes without a valid range bound fall back to LIKE."""
+    print("=== Testing prefix bound fallback ===")
+    print()
+    
+    assert _nocase_prefix_bounds("ACH") == ("ach", "aci")
+    assert _nocase_prefix_bounds("az") == ("az", "a{")
+    assert _nocase_prefix_bounds("a\U0010FFFF") is None
+    assert _nocase_prefix_bounds("a\uD7FF") is None
+    assert _nocase_prefix_bounds("a@") is None
+    assert _nocase_prefix_bounds("a_b") is None
+    assert _nocase_prefix_bounds("") is None
+    print("✓ Unrepresentable bounds fall back to LIKE\n")
+
+
+def test_filtered_samples_without_sample_anno():
+    """Test that a filtered sample listing reports a missing sample_anno table."""
+    print("=== Testing filtered samples without sample_anno ===")
+    print()
+    
+    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp_db:
+        db_path = tmp_db.name
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE TEST_mRNA (feature_id TEXT)")
+    conn.commit()
+    conn.close()
+    
+    try:
+        with _DatabasePath(db_path):
+            request = ListSamplesModel(project_name="TEST", pattern="^ACH", tumor_type="lung")
+            result = asyncio.run(list_droma_samples(MockContext(), request))
+        print(f"Result: {result}")
+        assert result["status"] == "error"
+        assert "sample_anno" in result["message"]
+        assert not result["message"].startswith("Failed to list samples")
+        print("✓ Missing table reported by the sample query\n")
+    
+    finally:
+        os.unlink(db_path)
+
+
+def test_caches_follow_database_changes():
+    """Test that the schema, row count and project caches refresh when the file changes."""
+    print("=== Testing cache invalidation on database changes ===")
+    print()
+    
+    db_path = _create_test_database()
+    try:
+        with _DatabasePath(db_path):
+            annotation_request = GetAnnotationModel(anno_type="sample", limit=2, include_total=True)
+            projects_request = ListProjectsModel(show_names_only=True)
+            new_features_request = ListFeaturesModel(project_name="NEW", data_sources="mRNA")
+            
+            # Fill the caches, then check they are reused while the file is unchanged
+            for _ in range(2):
+                assert _query_annotation(annotation_request)["total_in_database"] == len(SAMPLE_IDS)
+                assert _query_projects(projects_request)["project_names"] == ["TEST"]
+                assert _query_features(new_features_request)["status"] == "error"
+            
+            conn = sqlite3.connect(db_path)
+            conn.execute("INSERT INTO sample_anno VALUES ('NEW-001', 'NEW', 'CellLine', 'lung')")
+            conn.execute("CREATE TABLE NEW_mRNA (feature_id TEXT)")
+            conn.execute("INSERT INTO NEW_mRNA VALUES ('MYC')")
+            conn.commit()
+            conn.close()
+            # Make sure the modification time differs even on coarse-grained filesystems
+            stat = os.stat(db_path)
+            os.utime(db_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            
+            result = _query_annotation(annotation_request)
+            print(f"Annotation total: {result['total_in_database']}")
+            assert result["total_in_database"] == len(SAMPLE_IDS) + 1
+            
+            result = _query_projects(projects_request)
+            print(f"Projects: {result['project_names']}")
+            assert result["project_names"] == ["NEW", "TEST"]
+            
+            result = _query_features(new_features_request)
+            print(f"New features: {result}")
+            assert result["status"] == "success"
+            assert result["features"] == ["MYC"]
+        print("✓ Caches refreshed after the database changed\n")
+    
+    finally:
+        os.unlink(db_path)
+
+
+def run_all_tests():
+    """Run all database query tests."""
+    print("DROMA MCP Database Query Tests")
+    print("=" * 60)
+    print()
+    
+    tests = [
+        test_prefix_pattern_matches_like,
+        test_fts_pattern_matches_like,
+        test_annotation_chunks,
+        test_annotation_output_formats,
+        test_prefix_bounds_fallback,
+        test_filtered_samples_without_sample_anno,
+        test_caches_follow_database_changes
+    ]
+    
+    for test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_func.__name__} PASSED")
+        except Exception as e:
+            print(f"❌ {test_func.__name__} FAILED: {str(e)}")
+            import traceback
+            traceback.print_exc()
+        print("-" * 60)
+        print()
+
+
+if __name__ == "__main__":
+    run_all_tests()
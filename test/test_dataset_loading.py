@@ -55,6 +55,10 @@ class MockDromaState:
         
         return True
     
+    async def run_r(self, func, *args, **kwargs):
+        """Run an R callable inline (the real state uses a dedicated R thread)."""
+        return func(*args, **kwargs)
+    
     def get_dataset(self, dataset_id=None):
         if dataset_id:
             return self.datasets.get(dataset_id)
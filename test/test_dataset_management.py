@@ -15,13 +15,21 @@ from src.droma_mcp.server.dataset_management import (
     load_dataset, 
     list_loaded_datasets, 
     set_active_dataset, 
-    unload_dataset
+    unload_dataset,
+    unload_datasets
 )
 from src.droma_mcp.schema.dataset_management import (
     LoadDatasetModel, 
     ListDatasetsModel, 
     SetActiveDatasetModel, 
-    UnloadDatasetModel
+    UnloadDatasetModel,
+    UnloadDatasetsModel
+)
+
+# Call the tools' functions directly rather than through the MCP server
+load_dataset, list_loaded_datasets, set_active_dataset, unload_dataset, unload_datasets = (
+    getattr(tool, "fn", tool)
+    for tool in (load_dataset, list_loaded_datasets, set_active_dataset, unload_dataset, unload_datasets)
 )
 
 
@@ -89,6 +97,10 @@ class MockDromaState:
         
         return True
     
+    async def run_r(self, func, *args, **kwargs):
+        """Run an R callable inline (the real state uses a dedicated R thread)."""
+        return func(*args, **kwargs)
+    
     def get_dataset(self, dataset_id=None):
         """Get dataset R object name."""
         if dataset_id:
@@ -120,6 +132,18 @@ class MockDromaState:
             self.active_multidataset = dataset_id
         else:
             raise ValueError(f"Invalid dataset type: {dataset_type}")
+    
+    def remove_dataset(self, dataset_id: str, dataset_type: str = "DromaSet"):
+        """Remove a dataset and clear it as active."""
+        if dataset_type == "DromaSet":
+            r_name = self.datasets.pop(dataset_id, None)
+            if self.active_dataset == dataset_id:
+                self.active_dataset = None
+        else:
+            r_name = self.multidatasets.pop(dataset_id, None)
+            if self.active_multidataset == dataset_id:
+                self.active_multidataset = None
+        return r_name
 
 
 async def test_load_dataset():
@@ -376,6 +400,49 @@ async def test_unload_dataset():
     print("✓ Non-existent dataset warning handled correctly\n")
 
 
+async def test_unload_datasets():
+    """Test unloading several datasets at once."""
+    print("=== Testing unload_datasets ===")
+    print()
+    
+    droma_state = MockDromaState()
+    ctx = MockContext(droma_state)
+    
+    # Load some test datasets first
+    droma_state.datasets["CCLE"] = "droma_set_CCLE"
+    droma_state.datasets["gCSI"] = "droma_set_gCSI"
+    droma_state.datasets["GDSC"] = "droma_set_GDSC"
+    droma_state.active_dataset = "CCLE"
+    
+    # Test 1: Unload several datasets, one of them not loaded
+    print("1. Unloading two DromaSets and a missing one:")
+    request = UnloadDatasetsModel(
+        dataset_ids=["CCLE", "gCSI", "NONEXISTENT"],
+        dataset_type="DromaSet"
+    )
+    result = await unload_datasets(ctx, request)
+    print(f"Result: {result}")
+    assert result["status"] == "success"
+    assert result["unloaded"] == ["CCLE", "gCSI"]
+    assert result["not_loaded"] == ["NONEXISTENT"]
+    assert list(droma_state.datasets) == ["GDSC"]
+    assert droma_state.active_dataset is None
+    assert droma_state.r.commands_executed == ['rm(list = c("droma_set_CCLE", "droma_set_gCSI"))']
+    print("✓ Datasets unloaded with a single rm() call\n")
+    
+    # Test 2: Nothing to unload
+    print("2. Unloading datasets that are not loaded:")
+    request = UnloadDatasetsModel(
+        dataset_ids=["CCLE"],
+        dataset_type="DromaSet"
+    )
+    result = await unload_datasets(ctx, request)
+    print(f"Result: {result}")
+    assert result["status"] == "warning"
+    assert len(droma_state.r.commands_executed) == 1
+    print("✓ Missing datasets warning handled correctly\n")
+
+
 async def test_database_path_validation():
     """Test database path validation."""
     print("=== Testing Database Path Validation ===")
@@ -511,6 +578,7 @@ async def run_all_tests():
         test_list_loaded_datasets,
         test_set_active_dataset,
         test_unload_dataset,
+        test_unload_datasets,
         test_database_path_validation,
         test_complete_workflow
     ]
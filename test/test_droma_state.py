@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Tests for DROMA MCP server state: the data cache and dataset registry."""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+
+# Add the src directory to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent / ".."))
+
+from src.droma_mcp.server import DromaState
+from src.droma_mcp.server.dataset_management import unload_datasets
+from src.droma_mcp.schema.dataset_management import UnloadDatasetsModel
+
+# Call the tool's function directly rather than through the MCP server
+unload_datasets = getattr(unload_datasets, "fn", unload_datasets)
+
+
+class MockContext:
+    """Mock context for testing."""
+    
+    def __init__(self, droma_state):
+        self.request_context = Mock()
+        self.request_context.lifespan_context = droma_state
+    
+    async def info(self, message):
+        print(f"INFO: {message}")
+    
+    async def error(self, message):
+        print(f"ERROR: {message}")
+
+
+def _state_with_limits(max_entries: int, max_bytes: int) -> DromaState:
+    """Create a DromaState whose data cache uses the given limits."""
+    previous = {name: os.environ.get(name) for name in ('DROMA_CACHE_MAX', 'DROMA_CACHE_MAX_BYTES')}
+    os.environ['DROMA_CACHE_MAX'] = str(max_entries)
+    os.environ['DROMA_CACHE_MAX_BYTES'] = str(max_bytes)
+    try:
+        return DromaState()
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def _frame(n_values: int) -> pd.DataFrame:
+    """Create a float64 frame holding n_values cells."""
+    return pd.DataFrame(np.zeros((n_values, 1)))
+
+
+def test_cache_evicts_by_count():
+    """Test that the data cache evicts its least recently used entry past the entry limit."""
+    print("=== Testing LRU eviction by entry count ===")
+    print()
+    
+    droma_state = _state_with_limits(max_entries=3, max_bytes=2 ** 40)
+    try:
+        for key in ("a", "b", "c"):
+            droma_state.cache_data(key, _frame(10))
+        # Reading "a" makes "b" the least recently used entry
+        assert droma_state.get_cached_data("a") is not None
+        droma_state.cache_data("d", _frame(10))
+        
+        print(f"Cached keys: {list(droma_state.data_cache)}")
+        assert list(droma_state.data_cache) == ["c", "a", "d"]
+        assert droma_state.get_cached_data("b") is None
+        assert droma_state.cache_bytes == sum(entry.nbytes for entry in droma_state.data_cache.values())
+        print("✓ Least recently used entry evicted\n")
+    finally:
+        droma_state.close()
+
+
+def test_cache_evicts_by_bytes():
+    """Test that the data cache evicts entries until a new one fits the byte limit."""
+    print("=== Testing LRU eviction by size ===")
+    print()
+    
+    entry_bytes = _frame(1000).memory_usage(deep=True).sum()
+    droma_state = _state_with_limits(max_entries=100, max_bytes=int(entry_bytes * 2.5))
+    try:
+        droma_state.cache_data("a", _frame(1000))
+        droma_state.cache_data("b", _frame(1000))
+        droma_state.cache_data("c", _frame(1000))
+        print(f"Cached keys: {list(droma_state.data_cache)}")
+        assert list(droma_state.data_cache) == ["b", "c"]
+        
+        # Replacing a key releases its old size before checking the limit
+        droma_state.cache_data("c", _frame(1000))
+        assert list(droma_state.data_cache) == ["b", "c"]
+        
+        # An entry larger than the limit is still kept, on its own
+        droma_state.cache_data("big", _frame(5000))
+        assert list(droma_state.data_cache) == ["big"]
+        assert droma_state.cache_bytes == droma_state.data_cache["big"].nbytes
+        print("✓ Entries evicted to stay within the byte limit\n")
+    finally:
+        droma_state.close()
+
+
+def test_unload_datasets_partially_loaded():
+    """Test unloading a mix of loaded and unknown datasets on the real state."""
+    print("=== Testing unload_datasets with some datasets not loaded ===")
+    print()
+    
+    droma_state = DromaState()
+    try:
+        # Register datasets directly; R is not needed to unload them
+        droma_state.datasets.update({"CCLE": "CCLE", "gCSI": "gCSI"})
+        droma_state.multidatasets["CCLE,gCSI"] = "CCLE_gCSI"
+        droma_state.active_dataset = "CCLE"
+        assert droma_state.list_datasets()["datasets"] == ["CCLE", "gCSI"]
+        
+        request = UnloadDatasetsModel(dataset_ids=["CCLE", "GDSC"], dataset_type="DromaSet")
+        result = asyncio.run(unload_datasets(MockContext(droma_state), request))
+        print(f"Result: {result}")
+        assert result["status"] == "success"
+        assert result["unloaded"] == ["CCLE"]
+        assert result["not_loaded"] == ["GDSC"]
+        assert result["remaining_datasets"] == {"datasets": ["gCSI"], "multidatasets": ["CCLE,gCSI"]}
+        assert droma_state.active_dataset is None
+        assert droma_state.get_dataset() is None
+        
+        request = UnloadDatasetsModel(dataset_ids=["CCLE", "GDSC"], dataset_type="DromaSet")
+        result = asyncio.run(unload_datasets(MockContext(droma_state), request))
+        assert result["status"] == "warning"
+        assert result["not_loaded"] == ["CCLE", "GDSC"]
+        print("✓ Loaded datasets removed and unknown ones reported\n")
+    finally:
+        droma_state.close()
+
+
+def run_all_tests():
+    """Run all DROMA state tests."""
+    print("DROMA MCP State Tests")
+    print("=" * 60)
+    print()
+    
+    tests = [
+        test_cache_evicts_by_count,
+        test_cache_evicts_by_bytes,
+        test_unload_datasets_partially_loaded
+    ]
+    
+    for test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_func.__name__} PASSED")
+        except Exception as e:
+            print(f"❌ {test_func.__name__} FAILED: {str(e)}")
+            import traceback
+            traceback.print_exc()
+        print("-" * 60)
+        print()
+
+
+if __name__ == "__main__":
+    run_all_tests()
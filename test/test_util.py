@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Tests for DROMA MCP utility functions."""
+
+import io
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+# Add the src directory to Python path for imports
+sys.path.insert(0, str(Path(__file__).parent / ".."))
+
+from src.droma_mcp import util
+from src.droma_mcp.util import EXPORTS, save_analysis_result
+
+
+def test_csv_export_round_trip():
+    """Test that a mixed-dtype frame exports to CSV and reads back unchanged."""
+    print("=== Testing CSV export round trip ===")
+    print()
+    
+    result_df = pd.DataFrame({
+        "gene": ["TP53", "EGFR", None],
+        "count": [1, 2, 3],
+        "score": [0.5, -1.25, float("nan")],
+        "significant": [True, False, True],
+        # Mixed object columns cannot be converted to Arrow
+        "mixed": [1, "a", 2.5]
+    })
+    
+    # With pyarrow installed, the frame without the mixed column takes the
+    # Arrow writer and the full frame falls back to pandas
+    for frame in (result_df.drop(columns="mixed"), result_df):
+        export_id = save_analysis_result(frame, format="csv")
+        filepath = EXPORTS[export_id].path
+        try:
+            exported = pd.read_csv(filepath)
+            expected = pd.read_csv(io.StringIO(frame.to_csv(index=False)))
+            print(f"Exported:\n{exported}")
+            pd.testing.assert_frame_equal(exported, expected)
+        finally:
+            del EXPORTS[export_id]
+            os.unlink(filepath)
+    print("✓ CSV exports read back like the pandas writer's output\n")
+
+
+def _export_text(frame: pd.DataFrame) -> str:
+    """Export a frame to CSV and return the file's text."""
+    export_id = save_analysis_result(frame, format="csv")
+    filepath = EXPORTS.pop(export_id).path
+    try:
+        with open(filepath) as f:
+            return f.read()
+    finally:
+        os.unlink(filepath)
+
+
+def test_csv_export_text():
+    """Test the exact CSV text written by the pandas and Arrow writers."""
+    print("=== Testing CSV export text ===")
+    print()
+    
+    frame = pd.DataFrame({
+        "gene": ["TP53", None],
+        "count": [1, 2],
+        "score": [1.0, 1e-05],
+        "significant": [True, False]
+    })
+    
+    arrow_csv = util._arrow_csv
+    util._arrow_csv = lambda: None
+    try:
+        pandas_text = _export_text(frame)
+    finally:
+        util._arrow_csv = arrow_csv
+    print(f"pandas writer:\n{pandas_text}")
+    assert pandas_text == "gene,count,score,significant\nTP53,1,1.0,True\n,2,1e-05,False\n"
+    
+    if util._arrow_csv() is None:
+        print("pyarrow not installed, skipping the Arrow writer\n")
+        return
+    
+    # Arrow quotes the header and strings and formats booleans and floats its
+    # own way; the README documents the difference
+    arrow_text = _export_text(frame)
+    print(f"Arrow writer:\n{arrow_text}")
+    assert arrow_text == '"gene","count","score","significant"\n"TP53",1,1,true\n,2,0.00001,false\n'
+    print("✓ CSV text matches each writer's documented format\n")
+
+
+def test_export_reuses_identical_content():
+    """Test that auto-named exports are keyed by content, format and dtypes."""
+    print("=== Testing content-addressed export names ===")
+    print()
+    
+    frame = pd.DataFrame({"gene": ["TP53", "EGFR"], "score": [0.5, -1.25]})
+    export_ids = set()
+    try:
+        first_id = save_analysis_result(frame, format="csv")
+        export_ids.add(first_id)
+        filepath = Path(EXPORTS[first_id].path)
+        first_mtime = filepath.stat().st_mtime_ns
+        os.utime(filepath, ns=(first_mtime - 1_000_000_000, first_mtime - 1_000_000_000))
+        
+        # The same content, in a new but equal frame, reuses the saved file
+        second_id = save_analysis_result(frame.copy(), format="csv")
+        print(f"Saved twice: {first_id}, {second_id}")
+        assert second_id == first_id
+        assert filepath.stat().st_mtime_ns == first_mtime - 1_000_000_000
+        
+        # Another format or another dtype gets its own export
+        json_id = save_analysis_result(frame, format="json")
+        export_ids.add(json_id)
+        float32_id = save_analysis_result(frame.astype({"score": "float32"}), format="csv")
+        export_ids.add(float32_id)
+        print(f"Other format: {json_id}, other dtype: {float32_id}")
+        assert len({first_id, json_id, float32_id}) == 3
+        
+        # Cells that cannot be hashed fall back to a counter name
+        list_id = save_analysis_result(pd.DataFrame({"genes": [["TP53"], ["EGFR", "KRAS"]]}), format="json")
+        export_ids.add(list_id)
+        print(f"Unhashable cells: {list_id}")
+        assert list_id.startswith("droma_analysis_")
+        assert list_id[len("droma_analysis_"):].isdigit()
+        print("✓ Identical exports reused, others kept apart\n")
+    finally:
+        for export_id in export_ids:
+            entry = EXPORTS.pop(export_id, None)
+            if entry is not None:
+                Path(entry.path).unlink(missing_ok=True)
+
+
+def test_export_recreates_removed_directory():
+    """Test that exports still save after the export directory is removed."""
+    print("=== Testing export directory removal ===")
+    print()
+    
+    export_dir = util._EXPORT_DIR
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        util._EXPORT_DIR = Path(tmp_dir) / "exports"
+        try:
+            for value in (1, 2):
+                export_id = save_analysis_result(pd.DataFrame({"value": [value]}), format="csv")
+                filepath = Path(EXPORTS.pop(export_id).path)
+                assert filepath.exists()
+                # Simulate a tmp cleaner removing the directory between saves
+                filepath.unlink()
+                util._EXPORT_DIR.rmdir()
+        finally:
+            util._EXPORT_DIR = export_dir
+    print("✓ Export directory recreated on the next save\n")
+
+
+def run_all_tests():
+    """Run all utility tests."""
+    print("DROMA MCP Utility Tests")
+    print("=" * 60)
+    print()
+    
+    tests = [
+        test_csv_export_round_trip,
+        test_csv_export_text,
+        test_export_reuses_identical_content,
+        test_export_recreates_removed_directory
+    ]
+    
+    for test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_func.__name__} PASSED")
+        except Exception as e:
+            print(f"❌ {test_func.__name__} FAILED: {str(e)}")
+            import traceback
+            traceback.print_exc()
+        print("-" * 60)
+        print()
+
+
+if __name__ == "__main__":
+    run_all_tests()